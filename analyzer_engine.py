@@ -7,7 +7,9 @@ from presidio_analyzer import (
     RecognizerResult,
     EntityRecognizer,
 )
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from presidio_analyzer.app_tracer import AppTracer
+from presidio_analyzer.pattern_prefilter import PatternPrefilter
 from presidio_analyzer.context_aware_enhancers import (
     ContextAwareEnhancer,
     LemmaContextAwareEnhancer,
@@ -90,6 +92,9 @@ class AnalyzerEngine:
 
         self.context_aware_enhancer = context_aware_enhancer
 
+        # Finds in one scan which pattern recognizers have nothing to match
+        self.pattern_prefilter = PatternPrefilter()
+
     def get_recognizers(self, language: Optional[str] = None) -> List[EntityRecognizer]:
         """
         Return a list of PII recognizers currently loaded.
@@ -196,22 +201,31 @@ class AnalyzerEngine:
                 correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
             )
 
-        results = []
-        for recognizer in recognizers:
-            # Lazy loading of the relevant recognizers
-            if not recognizer.is_loaded:
-                recognizer.load()
-                recognizer.is_loaded = True
-
-            # analyze using the current recognizer and append the results
-            current_results = recognizer.analyze(
-                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+        # Recognizers lowercasing or encoding the text share one copy of it
+        with Utils.shared_text_copies(text):
+            skipped_recognizers = self.pattern_prefilter.get_skipped_recognizers(
+                text, recognizers
             )
-            if current_results:
-                # add recognizer name to recognition metadata inside results
-                # if not exists
-                self.__add_recognizer_id_if_not_exists(current_results, recognizer)
-                results.extend(current_results)
+
+            results = []
+            for recognizer in recognizers:
+                if recognizer.id in skipped_recognizers:
+                    continue
+
+                # Lazy loading of the relevant recognizers
+                if not recognizer.is_loaded:
+                    recognizer.load()
+                    recognizer.is_loaded = True
+
+                # analyze using the current recognizer and append the results
+                current_results = recognizer.analyze(
+                    text=text, entities=entities, nlp_artifacts=nlp_artifacts
+                )
+                if current_results:
+                    # add recognizer name to recognition metadata inside results
+                    # if not exists
+                    self.__add_recognizer_id_if_not_exists(current_results, recognizer)
+                    results.extend(current_results)
 
         results = self._enhance_using_context(
             text, results, nlp_artifacts, recognizers, context
@@ -1,4 +1,43 @@
-from typing import List, Tuple
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Luhn value of every second digit (doubled, minus 9 above 9), indexed by
+# ASCII code for bytes.translate
+_LUHN_DOUBLED = bytes(
+    (2 * (c - 48) - 9 if c >= 53 else 2 * (c - 48)) if 48 <= c <= 57 else 0
+    for c in range(256)
+)
+# The same table as a NumPy array, for fancy indexing a matrix of codes
+_LUHN_DOUBLED_ARRAY = (
+    np.frombuffer(_LUHN_DOUBLED, dtype=np.uint8).astype(np.int32)
+    if np is not None
+    else None
+)
+
+# Below this many numbers NumPy's call overhead outweighs vectorization
+_LUHN_BATCH_THRESHOLD = 8
+
+# Deletes every ASCII character but the digits
+_NON_DIGIT_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not 48 <= c <= 57)
+)
+_NON_DIGIT_REGEX = re.compile(r"\D")
+
+# The ASCII characters the regex package's \s matches, as RE2 class contents
+_WHITESPACE = "\\t\\n\\v\\f\\r "
+
+# The document under analysis and the copies derived from it, per context so
+# concurrent analyses each see their own
+_SHARED_TEXT_COPIES: ContextVar[Optional[Tuple[str, Dict[str, Any]]]] = ContextVar(
+    "shared_text_copies", default=None
+)
 
 
 class PresidioAnalyzerUtils:
@@ -23,6 +62,116 @@ class PresidioAnalyzerUtils:
             palindrome_text = palindrome_text.replace(" ", "").lower()
         return palindrome_text == palindrome_text[::-1]
 
+    @staticmethod
+    @contextmanager
+    def shared_text_copies(text: str) -> Iterator[None]:
+        """
+        Share the copies derived from a document while it is being analyzed.
+
+        Within the block, recognizers calling lower_text or ascii_bytes on
+        this very text object get one copy computed on first use, instead of
+        each allocating their own. The copies are dropped when the block exits.
+
+        :param text: the document under analysis
+        """
+        token = _SHARED_TEXT_COPIES.set((text, {}))
+        try:
+            yield
+        finally:
+            _SHARED_TEXT_COPIES.reset(token)
+
+    @staticmethod
+    def _shared_copies(text: str) -> Optional[Dict[str, Any]]:
+        """The copies shared for the text, if it is the document under analysis."""
+        shared = _SHARED_TEXT_COPIES.get()
+        if shared is not None and shared[0] is text:
+            return shared[1]
+        return None
+
+    @staticmethod
+    def lower_text(text: str) -> str:
+        """
+        Lowercase the input text, shared within shared_text_copies.
+
+        :param text: input text
+        :return: lowercased text
+        """
+        copies = PresidioAnalyzerUtils._shared_copies(text)
+        if copies is None:
+            return text.lower()
+        if "lower" not in copies:
+            copies["lower"] = text.lower()
+        return copies["lower"]
+
+    @staticmethod
+    def ascii_bytes(text: str) -> Optional[bytes]:
+        """
+        Encode pure ASCII input text, shared within shared_text_copies.
+
+        :param text: input text
+        :return: the encoded text, or None if the text is not pure ASCII
+        """
+        copies = PresidioAnalyzerUtils._shared_copies(text)
+        if copies is None:
+            return text.encode("ascii") if text.isascii() else None
+        if "ascii" not in copies:
+            copies["ascii"] = text.encode("ascii") if text.isascii() else None
+        return copies["ascii"]
+
+    @staticmethod
+    def to_re2_regex(regex: str) -> Optional[str]:
+        """
+        Spell a regex so RE2 matches ASCII text as the regex package does.
+
+        RE2's \\s leaves out the vertical tab, which the regex package's \\s
+        matches, so \\s and \\S are written out as explicit classes.
+
+        :param regex: regex pattern logic
+        :return: the RE2 spelling, or None if \\S appears inside a class
+        """
+        if "\\s" not in regex and "\\S" not in regex:
+            return regex
+
+        parts = []
+        in_class = False
+        i = 0
+        while i < len(regex):
+            char = regex[i]
+            if char == "\\" and i + 1 < len(regex):
+                escaped = regex[i + 1]
+                if escaped == "s":
+                    parts.append(_WHITESPACE if in_class else f"[{_WHITESPACE}]")
+                elif escaped == "S":
+                    if in_class:
+                        return None
+                    parts.append(f"[^{_WHITESPACE}]")
+                else:
+                    parts.append(regex[i:i + 2])
+                i += 2
+                continue
+
+            if in_class and regex.startswith("[:", i):
+                # A POSIX class such as [:alpha:] holds a "]" of its own
+                end = regex.find(":]", i + 2)
+                if end != -1:
+                    parts.append(regex[i:end + 2])
+                    i = end + 2
+                    continue
+            if not in_class and char == "[":
+                in_class = True
+                # A "]" right after the opening bracket (or "^") is literal
+                class_start = i + 2 if regex.startswith("[^", i) else i + 1
+                if regex.startswith("]", class_start):
+                    class_start += 1
+                parts.append(regex[i:class_start])
+                i = class_start
+                continue
+            if in_class and char == "]":
+                in_class = False
+            parts.append(char)
+            i += 1
+        return "".join(parts)
+
     @staticmethod
     def sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
         """
@@ -73,3 +222,84 @@ class PresidioAnalyzerUtils:
         for i in range(len(inverted_number)):
             c = __d__[c][__p__[i % 8][inverted_number[i]]]
         return __inv__[c] == 0
+
+    @staticmethod
+    def digits_of(text: str) -> str:
+        """
+        Strip every character but the decimal digits from the input text.
+
+        ASCII text goes through a str.translate deletion table, other text
+        through a regex that also keeps Unicode digits.
+
+        :param text: input text
+        :return: the digits of the text
+        """
+        if text.isascii():
+            return text.translate(_NON_DIGIT_TABLE)
+        return _NON_DIGIT_REGEX.sub("", text)
+
+    @staticmethod
+    def are_luhn_numbers(numbers: List[str]) -> List[bool]:
+        """
+        Check whether each of the input numbers passes the Luhn checksum.
+
+        Large batches of ASCII numbers are left-padded with zeros, which the
+        checksum ignores, to the longest one and stacked into a byte matrix,
+        so the doubling, summing and modulo run vectorized in NumPy. Without
+        NumPy installed every number goes through is_luhn_number.
+
+        :param numbers: strings of decimal digits only
+        :return: True / False for each number, in order
+        """
+        if np is None or len(numbers) < _LUHN_BATCH_THRESHOLD:
+            return [PresidioAnalyzerUtils.is_luhn_number(number) for number in numbers]
+
+        valid = [False] * len(numbers)
+        indices = []
+        for i, number in enumerate(numbers):
+            if number.isascii():
+                indices.append(i)
+            else:
+                valid[i] = PresidioAnalyzerUtils.is_luhn_number(number)
+        if not indices:
+            return valid
+
+        width = max(1, max(len(numbers[i]) for i in indices))
+        matrix = np.frombuffer(
+            "".join([numbers[i].zfill(width) for i in indices]).encode("ascii"),
+            dtype=np.uint8,
+        ).reshape(-1, width)
+        # Counted from the right, the last digit and every second one before
+        # it are summed as they are, the others doubled
+        undoubled = matrix[:, (width - 1) % 2::2]
+        checksum = undoubled.sum(axis=1, dtype=np.int32) - 48 * undoubled.shape[1]
+        doubled = _LUHN_DOUBLED_ARRAY[matrix[:, width % 2::2]]
+        checksum += doubled.sum(axis=1, dtype=np.int32)
+        for i, is_valid in zip(indices, (checksum % 10 == 0).tolist()):
+            valid[i] = is_valid
+        return valid
+
+    @staticmethod
+    def is_luhn_number(digits: str) -> bool:
+        """
+        Check if the input digits pass the Luhn checksum.
+
+        ASCII digits are summed straight off their codes, the doubled ones
+        through a lookup table, without a Python loop per digit.
+
+        :param digits: string of decimal digits only
+        :return: True / False
+        """
+        if digits.isascii():
+            reversed_digits = digits.encode("ascii")[::-1]
+            undoubled = reversed_digits[0::2]
+            checksum = sum(undoubled) - 48 * len(undoubled)
+            checksum += sum(reversed_digits[1::2].translate(_LUHN_DOUBLED))
+            return checksum % 10 == 0
+
+        # Non-ASCII (e.g. full-width) digits need int() to be parsed
+        values = [int(digit) for digit in digits]
+        checksum = sum(values[-1::-2])
+        for value in values[-2::-2]:
+            checksum += value * 2 - 9 if value > 4 else value * 2
+        return checksum % 10 == 0
@@ -1,5 +1,8 @@
 import logging
+import os
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Dict, Optional
 
 from presidio_analyzer import RecognizerResult
@@ -7,6 +10,18 @@ from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
 
+# The recognizer of a batch_analyze worker process, set by its initializer
+_worker_recognizer: Optional["EntityRecognizer"] = None
+
+
+def _init_batch_worker(recognizer: "EntityRecognizer") -> None:
+    global _worker_recognizer
+    _worker_recognizer = recognizer
+
+
+def _analyze_in_worker(text: str, entities: List[str]) -> List[RecognizerResult]:
+    return _worker_recognizer.analyze(text, entities, None) or []
+
 
 class EntityRecognizer:
     """
@@ -88,6 +103,49 @@ class EntityRecognizer:
         """
         return None
 
+    def batch_analyze(
+        self,
+        texts: List[str],
+        entities: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze many independent texts, spread over a pool of processes.
+
+        Pattern matching and validation hold the GIL, so the texts are
+        analyzed in worker processes rather than threads. Each worker
+        receives a pickled copy of the recognizer once, when it starts.
+        Caches a recognizer fills while analyzing, such as the card issuer
+        by prefix, are kept per worker and not carried back.
+
+        :param texts: The texts to be analyzed
+        :param entities: The entities to detect, defaults to the supported ones
+        :param max_workers: Number of worker processes (executor default if None)
+        :return: The results of each text, in the order of the texts.
+        """
+        if entities is None:
+            entities = self.supported_entities
+
+        if max_workers == 1 or len(texts) < 2:
+            return [self.analyze(text, entities, None) or [] for text in texts]
+
+        workers = max_workers or os.cpu_count() or 1
+        # A few chunks per worker keep the pickling overhead per text low
+        # while still balancing uneven texts
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self,),
+        ) as executor:
+            return list(
+                executor.map(
+                    partial(_analyze_in_worker, entities=entities),
+                    texts,
+                    chunksize=chunksize,
+                )
+            )
+
     def enhance_using_context(
         self,
         text: str,
@@ -0,0 +1,144 @@
+import logging
+from collections import OrderedDict
+from typing import List, Set, Tuple, Optional
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from presidio_analyzer import EntityRecognizer, PatternRecognizer
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class PatternPrefilter:
+    """
+    Single-pass prefilter over the patterns of many pattern recognizers.
+
+    The patterns of every recognizer that relies solely on
+    PatternRecognizer.analyze are compiled into one google-re2 Set. One scan
+    of the text then tells which of those recognizers have at least one
+    pattern occurring in it; the others cannot return results and are skipped.
+
+    Each pattern is added case-insensitive, multiline and dot-all, which only
+    widens what it matches, with \\s spelled out to the regex package's
+    whitespace, so the prefilter never hides a real match. Recognizers with
+    patterns RE2 cannot compile (or would read differently) are always run.
+    Text that is not pure ASCII is not prefiltered, as RE2's \\d, \\w and \\b
+    are ASCII-only. Should the Set fail to match, for instance by running out
+    of memory, every recognizer is run.
+
+    :param max_cache_size: number of recognizer combinations whose Set is kept
+    """
+
+    # Memory budget for the Set's DFA, well above RE2's default
+    MAX_MEM = 64 << 20
+
+    # Index of the empty sentinel pattern, added to every Set first
+    SENTINEL_INDEX = 0
+
+    def __init__(self, max_cache_size: int = 16):
+        self.max_cache_size = max_cache_size
+        self._sets = OrderedDict()
+
+    def get_skipped_recognizers(
+        self, text: str, recognizers: List[EntityRecognizer]
+    ) -> Set[str]:
+        """
+        Return the ids of recognizers that cannot find anything in the text.
+
+        :param text: text to analyze
+        :param recognizers: recognizers about to analyze the text
+        :return: ids of the recognizers whose analyze call can be skipped
+        """
+        ascii_text = Utils.ascii_bytes(text)
+        if re2 is None or ascii_text is None:
+            return set()
+
+        key = tuple(
+            (recognizer.id, len(getattr(recognizer, "patterns", None) or ()))
+            for recognizer in recognizers
+        )
+        entry = self._sets.get(key)
+        if entry is None:
+            entry = self._build_set(recognizers)
+            self._sets[key] = entry
+            if len(self._sets) > self.max_cache_size:
+                self._sets.popitem(last=False)
+        else:
+            self._sets.move_to_end(key)
+
+        regex_set, owners, candidates = entry
+        if regex_set is None:
+            return set()
+
+        hits = regex_set.Match(ascii_text) or []
+        if self.SENTINEL_INDEX not in hits:
+            # The sentinel matches any text, so the match itself failed
+            logger.warning("Pattern prefilter failed to match, running all recognizers")
+            return set()
+        matched = {owners[index] for index in hits}
+        return candidates - matched
+
+    def _build_set(
+        self, recognizers: List[EntityRecognizer]
+    ) -> Tuple[Optional["re2.Set"], List[Optional[str]], Set[str]]:
+        options = re2.Options()
+        options.max_mem = self.MAX_MEM
+        options.log_errors = False
+
+        regex_set = re2.Set.SearchSet(options)
+        # The empty pattern matches any text, so its absence from the hits
+        # tells a failed match from one that found nothing
+        regex_set.Add("")
+        owners = [None]
+        candidates = set()
+        for recognizer in recognizers:
+            if not self._is_pattern_only(recognizer):
+                continue
+
+            regexes = [
+                Utils.to_re2_regex(pattern.regex) for pattern in recognizer.patterns
+            ]
+            try:
+                if None in regexes:
+                    raise re2.error("\\S inside a character class")
+                regexes = ["(?ims)" + regex for regex in regexes]
+                for regex in regexes:
+                    # RE2 reads "{,n}" as literal text rather than a quantifier
+                    if "{," in regex:
+                        raise re2.error("unsupported quantifier")
+                    re2.compile(regex, options)
+            except re2.error:
+                logger.debug(
+                    "Recognizer %s has patterns RE2 cannot compile, not prefiltered",
+                    recognizer.name,
+                )
+                continue
+
+            for regex in regexes:
+                regex_set.Add(regex)
+                owners.append(recognizer.id)
+            candidates.add(recognizer.id)
+
+        if not candidates:
+            return None, owners, candidates
+
+        try:
+            regex_set.Compile()
+        except re2.error:
+            logger.warning("Could not compile the pattern prefilter, skipping it")
+            return None, [], set()
+
+        return regex_set, owners, candidates
+
+    @staticmethod
+    def _is_pattern_only(recognizer: EntityRecognizer) -> bool:
+        """Whether the recognizer's results can only come from its patterns."""
+        return (
+            isinstance(recognizer, PatternRecognizer)
+            and type(recognizer).analyze is PatternRecognizer.analyze
+            and bool(recognizer.patterns)
+        )
@@ -1,9 +1,15 @@
 import datetime
 import logging
+from functools import lru_cache
 from typing import List, Optional, Dict
 
 import regex as re
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 from presidio_analyzer import (
     LocalRecognizer,
     Pattern,
@@ -12,6 +18,7 @@ from presidio_analyzer import (
     AnalysisExplanation,
 )
 from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -30,6 +37,18 @@ class PatternRecognizer(LocalRecognizer):
     including deny-lists.
     """
 
+    # Recognizers whose patterns use no lookarounds or backreferences can opt in
+    # to google-re2's linear-time engine for pure ASCII text, with \s spelled
+    # out to match the same whitespace. Other text, patterns RE2 cannot
+    # compile, and environments without the re2 package fall back to the
+    # regex package.
+    use_re2 = False
+
+    # Recognizers whose every match holds at least this many digits skip ASCII
+    # texts with fewer digits in total, counted with one str.translate in C
+    # instead of running each pattern over the whole text
+    min_digits = 0
+
     def __init__(
         self,
         supported_entity: str,
@@ -93,12 +112,28 @@ class PatternRecognizer(LocalRecognizer):
         """
         results = []
 
+        if self.min_digits and self._has_too_few_digits(text):
+            return results
+
         if self.patterns:
             pattern_result = self.__analyze_patterns(text, regex_flags)
             results.extend(pattern_result)
 
         return results
 
+    def _has_too_few_digits(self, text: str) -> bool:
+        """
+        Whether the text holds fewer than min_digits digits.
+
+        Only ASCII text is counted: other Unicode digits also match \\d.
+
+        :param text: Text to be analyzed
+        :return: True if no match is possible
+        """
+        if not text.isascii():
+            return False
+        return len(Utils.digits_of(text)) < self.min_digits
+
     def _deny_list_to_regex(self, deny_list: List[str]) -> Pattern:
         """
         Convert a list of words to a matching regex.
@@ -166,6 +201,52 @@ class PatternRecognizer(LocalRecognizer):
         )
         return explanation
 
+    def _compile_regex(self, regex: str, flags: int):
+        """
+        Compile a regex with the engine configured for this recognizer.
+
+        :param regex: regex pattern logic
+        :param flags: regex flags
+        :return: a compiled pattern exposing finditer
+        """
+        return self._compile_regex_cached(regex, flags, bool(self.use_re2 and re2))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compile_regex_cached(regex: str, flags: int, use_re2: bool):
+        # Shared by all instances: recognizers building their Pattern objects
+        # per instance would otherwise recompile them every time, and RE2
+        # keeps no compile cache of its own
+        re2_regex = Utils.to_re2_regex(regex) if use_re2 else None
+        if re2_regex is not None:
+            options = re2.Options()
+            options.case_sensitive = not flags & re.IGNORECASE
+            options.dot_nl = bool(flags & re.DOTALL)
+            options.log_errors = False
+            # RE2 has no multiline option, only the inline flag
+            if flags & re.MULTILINE:
+                re2_regex = f"(?m){re2_regex}"
+            try:
+                return re2.compile(re2_regex, options)
+            except re2.error:
+                logger.debug("re2 cannot compile %s, using regex instead", regex)
+
+        return re.compile(regex, flags=flags)
+
+    @staticmethod
+    def _finditer(compiled_regex, text: str, ascii_text: Optional[bytes] = None):
+        """
+        Iterate over the matches of a regex compiled by _compile_regex.
+
+        :param compiled_regex: pattern returned by _compile_regex
+        :param text: text to match
+        :param ascii_text: the text encoded, if it is pure ASCII
+        :return: an iterator of matches, with character offsets
+        """
+        if ascii_text is not None and not isinstance(compiled_regex, re.Pattern):
+            return compiled_regex.finditer(ascii_text)
+        return compiled_regex.finditer(text)
+
     def __analyze_patterns(
         self, text: str, flags: int = None
     ) -> List[RecognizerResult]:
@@ -179,10 +260,25 @@ class PatternRecognizer(LocalRecognizer):
         :return: A list of RecognizerResult
         """
         flags = flags if flags else self.global_regex_flags
+        # RE2 matches on UTF-8 and maps every str offset back to characters.
+        # For pure ASCII text byte and character offsets coincide, so the
+        # encoded text is matched directly and that mapping is skipped.
+        ascii_text = Utils.ascii_bytes(text)
         results = []
         for pattern in self.patterns:
             match_start_time = datetime.datetime.now()
-            matches = re.finditer(pattern.regex, text, flags=flags)
+
+            # Compile regex if flags differ from flags the regex was compiled with
+            if not pattern.compiled_regex or pattern.compiled_with_flags != flags:
+                pattern.compiled_with_flags = flags
+                pattern.compiled_regex = self._compile_regex(pattern.regex, flags)
+
+            compiled_regex = pattern.compiled_regex
+            if ascii_text is None and not isinstance(compiled_regex, re.Pattern):
+                # RE2's \d, \w and \b only know ASCII, so other text stays on
+                # the regex package and matches as it would without RE2
+                compiled_regex = self._compile_regex_cached(pattern.regex, flags, False)
+            matches = self._finditer(compiled_regex, text, ascii_text)
             match_time = datetime.datetime.now() - match_start_time
             logger.debug(
                 "--- match_time[%s]: %s.%s seconds",
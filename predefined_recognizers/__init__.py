@@ -1,148 +1,155 @@
 """Predefined recognizers package. Holds all the default recognizers."""
 
+import importlib
+
 from presidio_analyzer.predefined_recognizers.transformers_recognizer import (
     TransformersRecognizer,
 )
-from .aba_routing_recognizer import AbaRoutingRecognizer
-from .credit_card_recognizer import CreditCardRecognizer
-from .crypto_recognizer import CryptoRecognizer
-from .date_recognizer import DateRecognizer
-from .email_recognizer import EmailRecognizer
-from .es_nif_recognizer import EsNifRecognizer
-from .iban_recognizer import IbanRecognizer
-from .ip_recognizer import IpRecognizer
-from .it_driver_license_recognizer import ItDriverLicenseRecognizer
-from .it_fiscal_code_recognizer import ItFiscalCodeRecognizer
-from .it_identity_card_recognizer import ItIdentityCardRecognizer
-from .it_passport_recognizer import ItPassportRecognizer
-from .it_vat_code import ItVatCodeRecognizer
-from .medical_license_recognizer import MedicalLicenseRecognizer
-from .phone_recognizer import PhoneRecognizer
-from .sg_fin_recognizer import SgFinRecognizer
 from .spacy_recognizer import SpacyRecognizer
 from .stanza_recognizer import StanzaRecognizer
-from .uk_nhs_recognizer import NhsRecognizer
-from .url_recognizer import UrlRecognizer
-from .us_bank_recognizer import UsBankRecognizer
-from .us_driver_license_recognizer import UsLicenseRecognizer
-from .us_itin_recognizer import UsItinRecognizer
-from .us_passport_recognizer import UsPassportRecognizer
-from .us_ssn_recognizer import UsSsnRecognizer
-from .au_abn_recognizer import AuAbnRecognizer
-from .au_acn_recognizer import AuAcnRecognizer
-from .au_tfn_recognizer import AuTfnRecognizer
-# from .au_medicare_recognizer import AuMedicareRecognizer
-# from .in_pan_recognizer import InPanRecognizer
-from .pl_pesel_recognizer import PlPeselRecognizer
-from .azure_ai_language import AzureAILanguageRecognizer
-from .in_aadhaar_recognizer import InAadhaarRecognizer
-from .in_vehicle_registration_recognizer import InVehicleRegistrationRecognizer
-from .medical_number_recognizer import MedicalNumberRecognizer
-from .medical_record_number_recognizer import MedicalRecordNumberRecognizer
-from .date_of_birth_recognizer import DateOfBirthRecognizer
-from .encounter_number_recognizer import EncounterNumberRecognizer
-from .word_list_recognizer import WordlistRecognizer
-from .health_insurance_claim_number_recognizer import HICNRecognizer
-from .australia_bank_account_numbers_recognizer import AustraliaBankAccountRecognizer
-from .bank_state_branch_code_recognizer import BSBCodeRecognizer
-# from .australiabusiness_and_companynumbers_recognizer import AustraliaBusinessCompanyNumberRecognizer
-from .australia_medicare_card_numbers_recognizer import AustraliaMedicareCardRecognizer
-from .au_bic_swift_numbers_reconizer import AustraliaBICRecognizer
-from .canada_bic_swift_numbers_reconizer import CanadaBICRecognizer
-from .canada_driving_license_recognizer import CanadaDriversLicenceRecognizer
-from .canada_social_insurance_numbers_recognizer import CanadaSINRecognizer
-from .canada_PIPEDA_recognizer import CanadaPIPEDARecognizer
-from .france_national_identification_numbers_recognizer import FranceNationalIdRecognizer
-from .france_driving_licence_numbers_recognizer import FranceDriversLicenceRecognizer
-from .hipaa_and_hitech_drug_recognizer import DrugRecognizer
-from .hipaa_and_hitech_ingredients_recognizer import IngredientRecognizer
-from .hipaa_and_hitech_ICD9_recognizer import ICD9Recognizer
-from .hipaa_and_hitech_ICD10_recognizer import ICD10Recognizer
-from .us_pin_recognizer import PatientIDRecognizer
-from .hipaa_and_hitech_low_threshold_recognizer import LowThresholdHIPAARecognizer
-from .business_terminology_recognizer import BusinessTerminologyRecognizer
-from .us_formatted_ssn import US_Formatted_SSN_Recognizer
-from .us_privacy_et_SSNTIN_recognizer import SSNAndTINRecognizer
-# from .hipaa_and_hitech_high import UnifiedRecognizer
-from .us_privacy_formatted_and_unformatted_ssn import SSN_Formatted_Unformatted_Recognizer
-from .germany_driving_licence_numbers_recognizer import GermanDriversLicenseRecognizer
-from .germany_national_identification_number_recognizer import GermanIDCardRecognizer
-from .germany_passport_numbers_recognizer import GermanPassportRecognizer
-from .german_iban_number_recognizer import GermanIBANRecognizer
-from .german_vat_number_recognizer import GermanVATRecognizer
-from .us_et_ferpa import FerpaRecognizer
-from .all_credit_card_number_recognizer import AllCreditCardNumberRecognizer
-from .cc_numbers_Issuer_recognizer import CreditCardIssuerRecognizer
-from .cc_track_data_attachments_recognizer import CCTrackDataRecognizer
-from .us_driving_license_number_recognizer import USDriversLicenseRecognizer
-# from .italy_BIC_swift_number_recognizer import ItalyBICSwiftRecognizer
-from .us_PCI_DSS_recognizer import PCI_DSS_CreditCardAndTrackDataRecognizer
-from .us_AZSB1338_recognizer import US_AZSB1338Recognizer
-from .ca_CASB1386_recognizer import CASB1386Recognizer
-from .us_COHB1119_recognizer import COHB1119Recognizer
-from .us_CTSB650_recognizer import ConnecticutDLPRecognizer
-from .us_DCCB16810_recognizer import ColumbiaDLPRecognizer
-from .us_FLHB481_recognizer import FLHB481Recognizer
-from .us_IDSB1374_recognizer import IdahoSB1374Recognizer
-from .us_LASB205_recognizer import LouisianaRecognizer
-from .us_MASS201_recognizer import MassachusettsDataRecognizer
-from .us_HF2121_recognizer import MinnesotaRecognizer
-from .us_NVSB347_recognizer import NevadaRecognizer
-from .us_NJA4001_recognizer import NewJerseyDLPRecognizer
-from .us_NHHB1660_recognizer import NewHampshirePolicyRecognizer
-from .us_NYAB4254_recognizer import NewYorkDataRecognizer
-from .us_OHHB104_recognizer import OhioDataRecognizer
-from .us_OKHB2357_recognizer import OklahomaRecognizer
-from .us_PASB712_recognizer import PennsylvaniaRecognizer
-from .us_TXSB122_recognizer import TexasPolicyRecognizer
-from .us_UTSB69_recognizer import UtahPolicyRecognizer
-from .us_WASB6043_recognizer import WashingtonStateRecognizer
-from .uk_driving_licence_numbers_recognizer import UKDriversLicenseRecognizer
-from .uk_et_UKNINO_recognizer import UKNINORecognizer
-from .uk_passport_recognizer import UKPassportRecognizer
-from .uk_tax_identification_number_recognizer import UKTaxpayerRecognizer
-from .italy_driving_licence_numbers_recognizer import ItalyDriversLicenseRecognizer
-from .Italy_fiscal_code_recognizer import ItalyFiscalCodeRecognizer
-from .italy_vat_numbers_recognizer import ItalyVATRecognizer
-from .netherlands_passport_numbers_recognizer import NetherlandsPassportRecognizer
-from .netherland_vat_numbers_recognizer import NetherlandsVATRecognizer
-from .spain_iban_numbers_recognizer import SpainIBANRecognizer
-from .spain_national_identification_numbers_recognizer import SpainDNIRecognizer
-from .spain_passport_number_recognizer import SpainPassportRecognizer
-from .spain_ssn_recognizer import SpainSSNRecognizer
-from .spain_vat_numbers_recognizer import SpainVATRecognizer
-from .eu_bic_numbers_recognizer import EUBICSwiftRecognizer
-from .italy_iban_numbers_recognizer import ItalyIBANRecognizer
-from .netherlands_iban_number_recognizer import NetherlandsIBANRecognizer
-from .netherlands_driving_licence_numbers_recognizer import NetherlandsDriversLicenseRecognizer
-from .netherlands_national_identification_numbers_recognizer import NetherlandsNationalIDRecognizer
-from .newzealand_Inland_revenue_department_number_recognizer import NewZealandInlandRevenueDepartmentNumberRecognizer
-from .newzealand_ministry_of_health_numbers_recognizer import NewZealandHealthNumberRecognizer
-from .france_bic_swift_numbers_recognizer import FranceBICSwiftRecognizer
-from .germany_bic_swift_numbers_recognizer import GermanyBICSwiftRecognizer
-from .netherland_bic_swift_numbers_recognizer import NetherlandsBICSwiftRecognizer
-from .spain_bic_swift_numbers_recognizer import SpainBICSwiftRecognizer
-from .sweden_national_Identification_numbers_recognizer import SwedenNationalIDRecognizer
-from .france_iban_numbers_recognizer import FranceIBANRecognizer
-from .france_vat_numbers_recognizer import FranceVATRecognizer
-from .us_custom_ssn_recognizer import USCustomSSNRecognizer
-from .eu_credit_card_number_recognizer import EUDebitCardRecognizer
-from .eu_iban_numbers_recognizer import EU_IBANRecognizer
-from .eu_vat_number_recognizer import EUVATRecognizer
-from .sweden_iban_numbers_recognizer import SwedenIBANRecognizer
-from .sweden_swift_bic_number_recognizer import SwedenBICSwiftRecognizer
-from .sweden_passport_numbers_recognizer import SwedenPassportRecognizer
-from .sweden_vat_number_recognizer import SwedenVATRecognizer
-from .custom_visa_credit_recognizer import VisaCreditCardRecognizer
-from .credit_card_number_45_or_67_recognizer import CreditCardRecognizer
-from .credit_debit_card_numbers_recognizer import DatotelCreditDebitCardRecognizer
-from .bsfinvest_custom_account_numbers_recognizer import BFSInvestCustomAccountRecognizer
-from .custom_BGFininc_wordlist_body_recognizer import BGFinincCustomWordlistRecognizer
-from .hipaa_hitech_medium_threshold_recognizer import HIPAAHITECHMEDIUMRecognizer
-from .dob_text_recognizer import DOBRecognizer
-from .npi_recognizer import NPIRecognizer
-from .hipaareg_recognizer import HipaaRegRecognizer
-from .us_CORPFIN_recognizer import USCorporateFinancialRecognizer
+
+# Recognizer name -> submodule defining it. Most submodules compile regexes or
+# load data files at import time, so they are only imported on first access
+# through the module level __getattr__ below (PEP 562).
+_LAZY_RECOGNIZERS = {
+    "AbaRoutingRecognizer": "aba_routing_recognizer",
+    "CryptoRecognizer": "crypto_recognizer",
+    "DateRecognizer": "date_recognizer",
+    "EmailRecognizer": "email_recognizer",
+    "EsNifRecognizer": "es_nif_recognizer",
+    "IbanRecognizer": "iban_recognizer",
+    "IpRecognizer": "ip_recognizer",
+    "ItDriverLicenseRecognizer": "it_driver_license_recognizer",
+    "ItFiscalCodeRecognizer": "it_fiscal_code_recognizer",
+    "ItIdentityCardRecognizer": "it_identity_card_recognizer",
+    "ItPassportRecognizer": "it_passport_recognizer",
+    "ItVatCodeRecognizer": "it_vat_code",
+    "MedicalLicenseRecognizer": "medical_license_recognizer",
+    "PhoneRecognizer": "phone_recognizer",
+    "SgFinRecognizer": "sg_fin_recognizer",
+    "NhsRecognizer": "uk_nhs_recognizer",
+    "UrlRecognizer": "url_recognizer",
+    "UsBankRecognizer": "us_bank_recognizer",
+    "UsLicenseRecognizer": "us_driver_license_recognizer",
+    "UsItinRecognizer": "us_itin_recognizer",
+    "UsPassportRecognizer": "us_passport_recognizer",
+    "UsSsnRecognizer": "us_ssn_recognizer",
+    "AuAbnRecognizer": "au_abn_recognizer",
+    "AuAcnRecognizer": "au_acn_recognizer",
+    "AuTfnRecognizer": "au_tfn_recognizer",
+    # "AuMedicareRecognizer": "au_medicare_recognizer",
+    # "InPanRecognizer": "in_pan_recognizer",
+    "PlPeselRecognizer": "pl_pesel_recognizer",
+    "AzureAILanguageRecognizer": "azure_ai_language",
+    "InAadhaarRecognizer": "in_aadhaar_recognizer",
+    "InVehicleRegistrationRecognizer": "in_vehicle_registration_recognizer",
+    "MedicalNumberRecognizer": "medical_number_recognizer",
+    "MedicalRecordNumberRecognizer": "medical_record_number_recognizer",
+    "DateOfBirthRecognizer": "date_of_birth_recognizer",
+    "EncounterNumberRecognizer": "encounter_number_recognizer",
+    "WordlistRecognizer": "word_list_recognizer",
+    "HICNRecognizer": "health_insurance_claim_number_recognizer",
+    "AustraliaBankAccountRecognizer": "australia_bank_account_numbers_recognizer",
+    "BSBCodeRecognizer": "bank_state_branch_code_recognizer",
+    # "AustraliaBusinessCompanyNumberRecognizer": "australiabusiness_and_companynumbers_recognizer",
+    "AustraliaMedicareCardRecognizer": "australia_medicare_card_numbers_recognizer",
+    "AustraliaBICRecognizer": "au_bic_swift_numbers_reconizer",
+    "CanadaBICRecognizer": "canada_bic_swift_numbers_reconizer",
+    "CanadaDriversLicenceRecognizer": "canada_driving_license_recognizer",
+    "CanadaSINRecognizer": "canada_social_insurance_numbers_recognizer",
+    "CanadaPIPEDARecognizer": "canada_PIPEDA_recognizer",
+    "FranceNationalIdRecognizer": "france_national_identification_numbers_recognizer",
+    "FranceDriversLicenceRecognizer": "france_driving_licence_numbers_recognizer",
+    "DrugRecognizer": "hipaa_and_hitech_drug_recognizer",
+    "IngredientRecognizer": "hipaa_and_hitech_ingredients_recognizer",
+    "ICD9Recognizer": "hipaa_and_hitech_ICD9_recognizer",
+    "ICD10Recognizer": "hipaa_and_hitech_ICD10_recognizer",
+    "PatientIDRecognizer": "us_pin_recognizer",
+    "LowThresholdHIPAARecognizer": "hipaa_and_hitech_low_threshold_recognizer",
+    "BusinessTerminologyRecognizer": "business_terminology_recognizer",
+    "US_Formatted_SSN_Recognizer": "us_formatted_ssn",
+    "SSNAndTINRecognizer": "us_privacy_et_SSNTIN_recognizer",
+    # "UnifiedRecognizer": "hipaa_and_hitech_high",
+    "SSN_Formatted_Unformatted_Recognizer": "us_privacy_formatted_and_unformatted_ssn",
+    "GermanDriversLicenseRecognizer": "germany_driving_licence_numbers_recognizer",
+    "GermanIDCardRecognizer": "germany_national_identification_number_recognizer",
+    "GermanPassportRecognizer": "germany_passport_numbers_recognizer",
+    "GermanIBANRecognizer": "german_iban_number_recognizer",
+    "GermanVATRecognizer": "german_vat_number_recognizer",
+    "FerpaRecognizer": "us_et_ferpa",
+    "AllCreditCardNumberRecognizer": "all_credit_card_number_recognizer",
+    "CreditCardIssuerRecognizer": "cc_numbers_Issuer_recognizer",
+    "CCTrackDataRecognizer": "cc_track_data_attachments_recognizer",
+    "USDriversLicenseRecognizer": "us_driving_license_number_recognizer",
+    # "ItalyBICSwiftRecognizer": "italy_BIC_swift_number_recognizer",
+    "PCI_DSS_CreditCardAndTrackDataRecognizer": "us_PCI_DSS_recognizer",
+    "US_AZSB1338Recognizer": "us_AZSB1338_recognizer",
+    "CASB1386Recognizer": "ca_CASB1386_recognizer",
+    "COHB1119Recognizer": "us_COHB1119_recognizer",
+    "ConnecticutDLPRecognizer": "us_CTSB650_recognizer",
+    "ColumbiaDLPRecognizer": "us_DCCB16810_recognizer",
+    "FLHB481Recognizer": "us_FLHB481_recognizer",
+    "IdahoSB1374Recognizer": "us_IDSB1374_recognizer",
+    "LouisianaRecognizer": "us_LASB205_recognizer",
+    "MassachusettsDataRecognizer": "us_MASS201_recognizer",
+    "MinnesotaRecognizer": "us_HF2121_recognizer",
+    "NevadaRecognizer": "us_NVSB347_recognizer",
+    "NewJerseyDLPRecognizer": "us_NJA4001_recognizer",
+    "NewHampshirePolicyRecognizer": "us_NHHB1660_recognizer",
+    "NewYorkDataRecognizer": "us_NYAB4254_recognizer",
+    "OhioDataRecognizer": "us_OHHB104_recognizer",
+    "OklahomaRecognizer": "us_OKHB2357_recognizer",
+    "PennsylvaniaRecognizer": "us_PASB712_recognizer",
+    "TexasPolicyRecognizer": "us_TXSB122_recognizer",
+    "UtahPolicyRecognizer": "us_UTSB69_recognizer",
+    "WashingtonStateRecognizer": "us_WASB6043_recognizer",
+    "UKDriversLicenseRecognizer": "uk_driving_licence_numbers_recognizer",
+    "UKNINORecognizer": "uk_et_UKNINO_recognizer",
+    "UKPassportRecognizer": "uk_passport_recognizer",
+    "UKTaxpayerRecognizer": "uk_tax_identification_number_recognizer",
+    "ItalyDriversLicenseRecognizer": "italy_driving_licence_numbers_recognizer",
+    "ItalyFiscalCodeRecognizer": "Italy_fiscal_code_recognizer",
+    "ItalyVATRecognizer": "italy_vat_numbers_recognizer",
+    "NetherlandsPassportRecognizer": "netherlands_passport_numbers_recognizer",
+    "NetherlandsVATRecognizer": "netherland_vat_numbers_recognizer",
+    "SpainIBANRecognizer": "spain_iban_numbers_recognizer",
+    "SpainDNIRecognizer": "spain_national_identification_numbers_recognizer",
+    "SpainPassportRecognizer": "spain_passport_number_recognizer",
+    "SpainSSNRecognizer": "spain_ssn_recognizer",
+    "SpainVATRecognizer": "spain_vat_numbers_recognizer",
+    "EUBICSwiftRecognizer": "eu_bic_numbers_recognizer",
+    "ItalyIBANRecognizer": "italy_iban_numbers_recognizer",
+    "NetherlandsIBANRecognizer": "netherlands_iban_number_recognizer",
+    "NetherlandsDriversLicenseRecognizer": "netherlands_driving_licence_numbers_recognizer",
+    "NetherlandsNationalIDRecognizer": "netherlands_national_identification_numbers_recognizer",
+    "NewZealandInlandRevenueDepartmentNumberRecognizer": "newzealand_Inland_revenue_department_number_recognizer",
+    "NewZealandHealthNumberRecognizer": "newzealand_ministry_of_health_numbers_recognizer",
+    "FranceBICSwiftRecognizer": "france_bic_swift_numbers_recognizer",
+    "GermanyBICSwiftRecognizer": "germany_bic_swift_numbers_recognizer",
+    "NetherlandsBICSwiftRecognizer": "netherland_bic_swift_numbers_recognizer",
+    "SpainBICSwiftRecognizer": "spain_bic_swift_numbers_recognizer",
+    "SwedenNationalIDRecognizer": "sweden_national_Identification_numbers_recognizer",
+    "FranceIBANRecognizer": "france_iban_numbers_recognizer",
+    "FranceVATRecognizer": "france_vat_numbers_recognizer",
+    "USCustomSSNRecognizer": "us_custom_ssn_recognizer",
+    "EUDebitCardRecognizer": "eu_credit_card_number_recognizer",
+    "EU_IBANRecognizer": "eu_iban_numbers_recognizer",
+    "EUVATRecognizer": "eu_vat_number_recognizer",
+    "SwedenIBANRecognizer": "sweden_iban_numbers_recognizer",
+    "SwedenBICSwiftRecognizer": "sweden_swift_bic_number_recognizer",
+    "SwedenPassportRecognizer": "sweden_passport_numbers_recognizer",
+    "SwedenVATRecognizer": "sweden_vat_number_recognizer",
+    "VisaCreditCardRecognizer": "custom_visa_credit_recognizer",
+    "CreditCardRecognizer": "credit_card_number_45_or_67_recognizer",
+    "DatotelCreditDebitCardRecognizer": "credit_debit_card_numbers_recognizer",
+    "BFSInvestCustomAccountRecognizer": "bsfinvest_custom_account_numbers_recognizer",
+    "BGFinincCustomWordlistRecognizer": "custom_BGFininc_wordlist_body_recognizer",
+    "HIPAAHITECHMEDIUMRecognizer": "hipaa_hitech_medium_threshold_recognizer",
+    "DOBRecognizer": "dob_text_recognizer",
+    "NPIRecognizer": "npi_recognizer",
+    "HipaaRegRecognizer": "hipaareg_recognizer",
+    "USCorporateFinancialRecognizer": "us_CORPFIN_recognizer",
+}
 
 NLP_RECOGNIZERS = {
     "spacy": SpacyRecognizer,
@@ -150,6 +157,21 @@ NLP_RECOGNIZERS = {
     "transformers": TransformersRecognizer,
 }
 
+
+def __getattr__(name: str):
+    """Import the submodule defining a predefined recognizer on first use."""
+    module_name = _LAZY_RECOGNIZERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    recognizer = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = recognizer
+    return recognizer
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_RECOGNIZERS))
+
+
 __all__ = [
     "AbaRoutingRecognizer",
     "CreditCardRecognizer",
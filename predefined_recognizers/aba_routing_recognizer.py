@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
 from presidio_analyzer import Pattern, PatternRecognizer
@@ -6,6 +7,9 @@ import re
 
 logger = logging.getLogger("presidio-analyzer")
 
+# ABA checksum weights for the nine routing number digits
+_CHECKSUM_WEIGHTS = (3, 7, 1, 3, 7, 1, 3, 7, 1)
+
 class AbaRoutingRecognizer(PatternRecognizer):
     logger.info("Initializing ABA Routing Recognizer...")
 
@@ -24,20 +28,15 @@ class AbaRoutingRecognizer(PatternRecognizer):
     This can allow a greater variety in input, for example by removing dashes or spaces.
     """
 
+    # Plain character-class patterns, safe for the linear-time RE2 engine
+    use_re2 = True
+
+    # A single pattern covers the plain 9-digit form as well as the
+    # XXXX-XXXX-X layout (dash or space separated), so the text is scanned once
     PATTERNS = [
         Pattern(
             "ABA routing number",
-            r"\b(00|01|02|03|04|05|06|07|08|10|11|12)\d{3}-\d{4}-\d\b",
-            0.5,
-        ),
-        Pattern(
-            "ABA routing number (high confidence)",
-            r"\b(00|01|02|03|04|05|06|07|08|10|11|12)\d{7}\b",  # 9-digit number starting with 00-12
-            0.95,
-        ),
-        Pattern(
-            "ABA routing number with hyphens (high confidence)",
-            r"\b(00|01|02|03|04|05|06|07|08|10|11|12)\d{2}-\d{4}-\d\b",  # Format: XX-XXXX-XXX
+            r"\b(0[0-8]|1[0-2])\d{2}[- ]?\d{4}[- ]?\d\b",
             0.95,
         ),
     ]
@@ -64,6 +63,9 @@ class AbaRoutingRecognizer(PatternRecognizer):
         "RTN",
     ]
 
+    # Context keywords lowercased once, matching the lowercased lemmas
+    _CONTEXT_LOWER = tuple(keyword.lower() for keyword in CONTEXT)
+
     def __init__(
         self,
         patterns: Optional[List[Pattern]] = None,
@@ -72,9 +74,15 @@ class AbaRoutingRecognizer(PatternRecognizer):
         supported_entity: str = "ABA_ROUTING_NUMBER",
         replacement_pairs: Optional[List[Tuple[str, str]]] = None,
     ):
-        self.replacement_pairs = replacement_pairs or [("-", "")]
+        self.replacement_pairs = replacement_pairs or [("-", ""), (" ", "")]
+        # Pairs that only delete single characters collapse into one translate
+        self._translate_table = (
+            str.maketrans("", "", "".join(s for s, _ in self.replacement_pairs))
+            if all(len(s) == 1 and not r for s, r in self.replacement_pairs)
+            else None
+        )
         patterns = patterns if patterns else self.PATTERNS
-        context = context if context else self.CONTEXT
+        context = context if context else list(self._CONTEXT_LOWER)
         super().__init__(
             supported_entity=supported_entity,
             patterns=patterns,
@@ -83,15 +91,37 @@ class AbaRoutingRecognizer(PatternRecognizer):
         )
 
     def validate_result(self, pattern_text: str) -> bool:  # noqa D102
-        sanitized_value = self.__sanitize_value(pattern_text, self.replacement_pairs)
+        if self._translate_table is not None:
+            sanitized_value = pattern_text.translate(self._translate_table)
+        else:
+            sanitized_value = self.__sanitize_value(
+                pattern_text, self.replacement_pairs
+            )
         return self.__checksum(sanitized_value)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def __checksum(sanitized_value: str) -> bool:
-        s = 0
-        for idx, m in enumerate([3, 7, 1, 3, 7, 1, 3, 7, 1]):
-            s += int(sanitized_value[idx]) * m
-        return s % 10 == 0
+        if len(sanitized_value) < len(_CHECKSUM_WEIGHTS):
+            return False
+        digits = sanitized_value[:9]
+        if not digits.isascii():
+            # Non-ASCII (e.g. full-width) digits need int() to be parsed
+            s = sum(
+                int(digit) * weight for digit, weight in zip(digits, _CHECKSUM_WEIGHTS)
+            )
+            return s % 10 == 0
+
+        # bytes.isdigit only accepts ASCII digits, so one C-level call
+        # rejects leftover separators or letters from custom patterns
+        d = digits.encode()
+        if not d.isdigit():
+            return False
+
+        # Weighted sum straight off the ASCII codes, removing the '0' offset
+        # once for the total weight (3 * (3 + 7 + 1) = 33)
+        s = 3 * (d[0] + d[3] + d[6]) + 7 * (d[1] + d[4] + d[7]) + (d[2] + d[5] + d[8])
+        return (s - 33 * ord("0")) % 10 == 0
 
     @staticmethod
     def __sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
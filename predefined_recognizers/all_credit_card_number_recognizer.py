@@ -1,13 +1,45 @@
 import re
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from typing import List, Optional, Dict, Any
 
+from ahocorasick import Automaton
+
+# Context term categories, as bit flags
+_NAME_TERM = 1
+_VERIFICATION_TERM = 2
+_BRAND_TERM = 4
+_CARD_KEYWORD = 8
+_NUMBER_KEYWORD = 16
+_ALL_TERMS = 31
+
+
+def _build_term_automaton(categories: Dict[int, List[str]]) -> Automaton:
+    """Build an Aho-Corasick automaton mapping every term to its category flags."""
+    term_flags: Dict[str, int] = {}
+    for flag, terms in categories.items():
+        for term in terms:
+            term_flags[term] = term_flags.get(term, 0) | flag
+    automaton = Automaton()
+    for term, flags in term_flags.items():
+        automaton.add_word(term, flags)
+    automaton.make_automaton()
+    return automaton
+
+
 class AllCreditCardNumberRecognizer(PatternRecognizer):
     """
     Recognizer to detect various credit card numbers with context-based scoring.
     Only validates with Luhn algorithm for card types specified in LUHN_CARD_TYPES.
     """
 
+    # Plain character-class patterns, matched on the linear-time RE2 engine
+    # for ASCII text (its \b and \d are ASCII-only)
+    use_re2 = True
+
+    # Skips ASCII texts too short in digits for any card
+    min_digits = 13
+
     # Card types requiring Luhn validation (from Trellix docs)
     LUHN_CARD_TYPES = {
         'American Express', 'Diner\'s Club', 'Discover',
@@ -39,6 +71,18 @@ class AllCreditCardNumberRecognizer(PatternRecognizer):
         'diners', 'jcb card', 'union pay'
     ]
 
+    CARD_KEYWORDS = ['card', 'cc', 'credit', 'payment']
+    NUMBER_KEYWORDS = ['number', 'num', 'no', '#', 'digits']
+
+    # Finds the terms of every category in a single pass over the text
+    _TERM_AUTOMATON = _build_term_automaton({
+        _NAME_TERM: CC_NAME_TERMS,
+        _VERIFICATION_TERM: VERIFICATION_TERMS,
+        _BRAND_TERM: CARD_BRAND_TERMS,
+        _CARD_KEYWORD: CARD_KEYWORDS,
+        _NUMBER_KEYWORD: NUMBER_KEYWORDS,
+    })
+
     # Regex for date patterns (MM/YY, MM/YYYY, etc.)
     DATE_REGEX = re.compile(r'\b(0[1-9]|1[0-2])[-/](\d{2}|\d{4})\b')
 
@@ -99,47 +143,61 @@ class AllCreditCardNumberRecognizer(PatternRecognizer):
             card_type: [re.compile(p) for p in patterns]
             for card_type, patterns in self.IGNORED_PATTERNS.items()
         }
+        # Card type, compiled regex and regex compiled for ASCII text of every
+        # pattern, in PATTERNS order
+        self.compiled_patterns = [
+            (card_type, re.compile(pattern.regex), self._compile_regex(pattern.regex, 0))
+            for card_type, pattern_list in self.PATTERNS.items()
+            for pattern in pattern_list
+        ]
 
     def analyze(self, text: str, entities: List[str], nlp_artifacts: Any = None) -> List[RecognizerResult]:
         """Analyze text with enhanced pattern matching and adjust scores for multiple cards"""
-        # First pass: collect all valid matches
+        # Every pattern needs at least 13 digits
+        if self._has_too_few_digits(text):
+            return []
+
+        # First pass: collect all valid matches. Each pattern scans the whole
+        # text, so a number rejected by one pattern may still start a card
+        # found by another, and a card several patterns match counts once
+        # per pattern.
+        ascii_text = Utils.ascii_bytes(text)
         matches = []
-        for card_type, pattern_list in self.PATTERNS.items():
-            for pattern in pattern_list:
-                for match in re.finditer(pattern.regex, text):
-                    start, end = match.span()
-                    text_fragment = text[start:end]
-                    clean_number = re.sub(r"[^\d]", "", text_fragment)
-
-                    if self._is_ignored(card_type, clean_number):
-                        continue
-                    if not self._valid_card(card_type, clean_number):
-                        continue
-
-                    matches.append((start, end, card_type, clean_number))
-        
+        for card_type, compiled, ascii_compiled in self.compiled_patterns:
+            if ascii_text is None:
+                pattern_matches = compiled.finditer(text)
+            else:
+                pattern_matches = self._finditer(ascii_compiled, text, ascii_text)
+            for match in pattern_matches:
+                start, end = match.span()
+                text_fragment = text[start:end]
+                clean_number = Utils.digits_of(text_fragment)
+
+                if self._is_ignored(card_type, clean_number):
+                    continue
+                if not self._valid_card(card_type, clean_number):
+                    continue
+
+                matches.append((start, end, card_type, clean_number))
+
         # Calculate base context score once (uses entire text)
         base_score = self._calculate_score(text) if matches else 0.0
-        n_matches = len(matches)
-        
-        # Create results with score adjustment for multiple cards
-        results = []
-        for (start, end, card_type, clean_number) in matches:
-            # Boost score if multiple valid cards found
-            if n_matches >= 2:
-                score = min(1.0, base_score + 0.2)
-            else:
-                score = base_score
-                
-            results.append(
-                RecognizerResult(
-                    entity_type="CREDIT_CARD",
-                    start=start,
-                    end=end,
-                    score=score
-                )
+
+        # Boost score if multiple valid cards found; every result shares it
+        if len(matches) >= 2:
+            score = min(1.0, base_score + 0.2)
+        else:
+            score = base_score
+
+        return [
+            RecognizerResult(
+                entity_type="CREDIT_CARD",
+                start=start,
+                end=end,
+                score=score
             )
-        return results
+            for start, end, _, _ in matches
+        ]
 
     def _is_ignored(self, card_type: str, text: str) -> bool:
         """Check against ignored patterns for specific card type"""
@@ -149,41 +207,43 @@ class AllCreditCardNumberRecognizer(PatternRecognizer):
                     return True
         return False
 
-    def _valid_card(self, card_type: str, card_number: str) -> bool:
+    def _valid_card(self, card_type: str, clean_number: str) -> bool:
         """Conditional Luhn validation based on card type"""
         # Only validate Luhn for specified card types
         if card_type not in self.LUHN_CARD_TYPES:
             return True
 
-        # Clean and validate number
-        clean_number = re.sub(r"[\s-]", "", card_number)
+        # analyze already stripped every non-digit; isdigit only rejects
+        # an empty number
         return clean_number.isdigit() and self._luhn_check(clean_number)
 
     def _luhn_check(self, card_number: str) -> bool:
         """Validate number using Luhn algorithm"""
-        total = 0
-        reverse_digits = card_number[::-1]
-        for i, digit in enumerate(reverse_digits):
-            num = int(digit)
-            if i % 2 == 1:
-                num *= 2
-                if num > 9:
-                    num -= 9
-            total += num
-        return total % 10 == 0
+        return Utils.is_luhn_number(card_number)
 
     def _calculate_score(self, text: str) -> float:
         """Calculate context score using entire text"""
-        context_text = text.lower()
-        
-        has_name_term = any(term in context_text for term in self.CC_NAME_TERMS)
-        has_verif_term = any(term in context_text for term in self.VERIFICATION_TERMS)
-        has_brand_term = any(brand in context_text for brand in self.CARD_BRAND_TERMS)
-        has_date = self.DATE_REGEX.search(context_text) is not None
-        has_card_keyword = any(word in context_text for word in ['card', 'cc', 'credit', 'payment'])
-        has_number_keyword = any(word in context_text for word in ['number', 'num', 'no', '#', 'digits'])
-
-        if has_name_term and has_verif_term and has_date:
+        context_text = Utils.lower_text(text)
+
+        found = 0
+        for _, flags in self._TERM_AUTOMATON.iter(context_text):
+            found |= flags
+            if found == _ALL_TERMS:
+                break
+
+        has_name_term = bool(found & _NAME_TERM)
+        has_verif_term = bool(found & _VERIFICATION_TERM)
+        has_brand_term = bool(found & _BRAND_TERM)
+        has_card_keyword = bool(found & _CARD_KEYWORD)
+        has_number_keyword = bool(found & _NUMBER_KEYWORD)
+
+        # A date only matters next to both a name and a verification term,
+        # so the date scan is skipped otherwise
+        if (
+            has_name_term
+            and has_verif_term
+            and self.DATE_REGEX.search(context_text) is not None
+        ):
             return 1.0
         elif has_name_term or has_brand_term or has_verif_term:
             return 0.8
@@ -1,7 +1,17 @@
-from typing import Optional, List, Set, Tuple
+from typing import Optional, List, Set, Tuple, FrozenSet, Iterable, Dict
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import re
-import csv
+import os
+import mmap
+
+# Layout of the BSB strings in KNOWN_BSB_NUMBERS and the BSB CSV
+_BSB_FORMAT = re.compile(r"[0-9]{3}-[0-9]{3}")
+
+# A BSB CSV row whose first field is a "123-456" BSB, optionally quoted
+_BSB_CSV_ROW = re.compile(
+    rb'^[ \t]*"?[ \t]*([0-9]{3})-([0-9]{3})[ \t]*"?[ \t]*(?:,|\r?$)', re.MULTILINE
+)
 
 class AustraliaBankAccountRecognizer(PatternRecognizer):
     """
@@ -62,8 +72,15 @@ class AustraliaBankAccountRecognizer(PatternRecognizer):
         "driver", "license", "licence", "permit", "identification"
     ]
 
+    # Candidate account numbers and BSBs searched for by analyze
+    ACCOUNT_REGEX = re.compile(r"\b\d{6,10}\b")
+    BSB_REGEX = re.compile(r"\b\d{3}[- ]?\d{3}\b")
+
     DEFAULT_PAIR_WINDOW = 120
 
+    # BSB sets parsed from CSV files, keyed by path, size and modification time
+    _BSB_CSV_CACHE: Dict[Tuple[str, int, int], FrozenSet[int]] = {}
+
     def __init__(
         self,
         patterns: Optional[List[Pattern]] = None,
@@ -76,12 +93,14 @@ class AustraliaBankAccountRecognizer(PatternRecognizer):
     ):
         patterns = patterns if patterns is not None else self.PATTERNS
 
-        # Load BSB numbers from CSV if path provided
+        # Load BSB numbers from CSV if path provided. They are stored as
+        # 6-digit integers: cheap to hash, no string building per lookup.
         if csv_file_path:
             self.known_bsb_numbers = self._load_bsb_from_csv(csv_file_path)
         else:
             # Use provided set or fallback to default
-            self.known_bsb_numbers = known_bsb_numbers if known_bsb_numbers is not None else self.KNOWN_BSB_NUMBERS
+            bsb_numbers = known_bsb_numbers if known_bsb_numbers is not None else self.KNOWN_BSB_NUMBERS
+            self.known_bsb_numbers = self._bsb_numbers_to_ints(bsb_numbers)
 
         super().__init__(
             supported_entity=supported_entity,
@@ -100,70 +119,151 @@ class AustraliaBankAccountRecognizer(PatternRecognizer):
         self.lower_context_set = set(kw.lower() for kw in effective_context)
         self.lower_negative_set = set(kw.lower() for kw in self.NEGATIVE_CONTEXT)
 
-    def _load_bsb_from_csv(self, csv_file_path: str) -> Set[str]:
+        # One literal alternation per term list: a single search replaces a
+        # substring test per keyword
+        self.context_regex = self._build_term_regex(self.lower_context_set)
+        self.negative_regex = self._build_term_regex(self.lower_negative_set)
+
+    @staticmethod
+    def _build_term_regex(terms: Iterable[str]) -> Optional["re.Pattern"]:
+        """Compile lowercased terms into one alternation, None if there are none"""
+        terms = sorted(terms)
+        if not terms:
+            return None
+        return re.compile("|".join(map(re.escape, terms)))
+
+    def _load_bsb_from_csv(self, csv_file_path: str) -> FrozenSet[int]:
         """Load BSB numbers from the first column of CSV file"""
-        bsb_numbers = set()
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if row and len(row) > 0:
-                        bsb = row[0].strip().strip('"')
-                        bsb_numbers.add(bsb)
+            stat = os.stat(csv_file_path)
+            # Recognizers built from the same, unchanged file share one parse
+            key = (os.path.abspath(csv_file_path), stat.st_size, stat.st_mtime_ns)
+            bsb_numbers = self._BSB_CSV_CACHE.get(key)
+            if bsb_numbers is None:
+                bsb_numbers = self._parse_bsb_csv(csv_file_path, stat.st_size)
+                self._BSB_CSV_CACHE[key] = bsb_numbers
             print(f"Loaded {len(bsb_numbers)} BSB numbers from {csv_file_path}")
         except FileNotFoundError:
             print(f"CSV file {csv_file_path} not found, using default BSB numbers")
-            return self.KNOWN_BSB_NUMBERS
+            return self._bsb_numbers_to_ints(self.KNOWN_BSB_NUMBERS)
         except Exception as e:
             print(f"Error loading BSB from CSV {csv_file_path}: {e}, using default BSB numbers")
-            return self.KNOWN_BSB_NUMBERS
-        
+            return self._bsb_numbers_to_ints(self.KNOWN_BSB_NUMBERS)
+
         return bsb_numbers
 
-    def _normalize_bsb(self, raw_bsb: str) -> Optional[str]:
-        """Normalize forms like '123456', '123 456', '123-456' -> '123-456'"""
+    @staticmethod
+    def _parse_bsb_csv(csv_file_path: str, size: int) -> FrozenSet[int]:
+        """Extract the BSBs of a CSV file with one regex pass over its memory map"""
+        if not size:
+            return frozenset()
+        with open(csv_file_path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return frozenset(
+                int(first + last) for first, last in _BSB_CSV_ROW.findall(mapped)
+            )
+
+    @staticmethod
+    def _bsb_numbers_to_ints(bsb_numbers: Iterable[str]) -> FrozenSet[int]:
+        """Convert '123-456' style BSB strings to a frozenset of 6-digit integers"""
+        return frozenset(
+            int(bsb[:3] + bsb[4:]) for bsb in bsb_numbers if _BSB_FORMAT.fullmatch(bsb)
+        )
+
+    def _normalize_bsb(self, raw_bsb: str) -> Optional[int]:
+        """Normalize forms like '123456', '123 456', '123-456' -> 123456"""
         if not raw_bsb:
             return None
-        digits = re.sub(r"\D", "", raw_bsb)
-        if len(digits) == 6:
-            return f"{digits[:3]}-{digits[3:]}"
+        digits = raw_bsb.replace("-", "").replace(" ", "")
+        if len(digits) == 6 and digits.isascii() and digits.isdigit():
+            return int(digits)
         return None
 
+    @staticmethod
+    def _format_bsb(bsb: Optional[int]) -> Optional[str]:
+        """Format a normalized BSB back to '123-456' for explanations"""
+        if bsb is None:
+            return None
+        return f"{bsb // 1000:03d}-{bsb % 1000:03d}"
+
     def analyze(self, text: str, entities: Optional[List[str]] = None, nlp_artifacts=None) -> List[RecognizerResult]:
         results: List[RecognizerResult] = []
         if not text:
             return results
 
-        text_lower = text.lower()
-        account_iter = list(re.finditer(r"\b\d{6,10}\b", text))
-        bsb_iter = list(re.finditer(r"\b\d{3}[- ]?\d{3}\b", text))
-
-        # Rule 4: both account and BSB must be present
-        if not account_iter or not bsb_iter:
+        # Rule 4: both account and BSB must be present. The BSB scan is only
+        # needed once an account candidate has been found.
+        account_iter = list(self.ACCOUNT_REGEX.finditer(text))
+        if not account_iter:
+            return results
+        bsb_iter = list(self.BSB_REGEX.finditer(text))
+        if not bsb_iter:
             return results
 
-        # check keywords robustly
-        has_keyword = any(kw in text_lower for kw in self.lower_context_set)
-        negative_present = any(neg in text_lower for neg in self.lower_negative_set)
+        # check keywords robustly (lowercased once, shared with other recognizers)
+        text_lower = Utils.lower_text(text)
+        has_keyword = (
+            self.context_regex is not None
+            and self.context_regex.search(text_lower) is not None
+        )
+        negative_present = (
+            self.negative_regex is not None
+            and self.negative_regex.search(text_lower) is not None
+        )
+
+        # Normalize every BSB once rather than once per account it pairs with
+        bsb_values = [self._normalize_bsb(bsb_m.group()) for bsb_m in bsb_iter]
 
-        seen_spans: Set[Tuple[int, int]] = set()
+        # Without a keyword only rule 3 can apply, which needs a known BSB:
+        # drop the others up front, and stop if none is left
+        if not has_keyword:
+            known_bsbs = [
+                (bsb_m, bsb_value)
+                for bsb_m, bsb_value in zip(bsb_iter, bsb_values)
+                if bsb_value in self.known_bsb_numbers
+            ]
+            if not known_bsbs:
+                return results
+            bsb_iter = [bsb_m for bsb_m, _ in known_bsbs]
+            bsb_values = [bsb_value for _, bsb_value in known_bsbs]
 
+        # Emitted spans, packed as start << 32 | end to avoid a tuple per pair
+        seen_spans: Set[int] = set()
+        # Accepted pairs, turned into results once the sweep is done
+        pairs = []
+
+        # Both match lists are sorted by position, so the BSBs close enough to
+        # an account form a window that only moves forward: sweep it instead
+        # of pairing every account with every BSB
+        first_bsb = 0
         for acc_m in account_iter:
             acc_val = acc_m.group()
             acc_start, acc_end = acc_m.start(), acc_m.end()
             valid_account = acc_val.isdigit() and 6 <= len(acc_val) <= 10
 
-            for bsb_m in bsb_iter:
-                raw_bsb = bsb_m.group()
+            # BSBs starting too far before this account are out of range for
+            # every later account as well
+            while (
+                first_bsb < len(bsb_iter)
+                and acc_end - bsb_iter[first_bsb].start() > self.pair_window
+            ):
+                first_bsb += 1
+
+            for bsb_index in range(first_bsb, len(bsb_iter)):
+                bsb_m = bsb_iter[bsb_index]
                 bsb_start, bsb_end = bsb_m.start(), bsb_m.end()
 
+                # ... and once a BSB ends too far after it, so do the rest
+                if bsb_end - acc_start > self.pair_window:
+                    break
+
                 # correct distance calculation
                 distance = max(acc_end, bsb_end) - min(acc_start, bsb_start)
                 if distance > self.pair_window:
                     continue
 
-                normalized_bsb = self._normalize_bsb(raw_bsb)
-                valid_bsb = normalized_bsb in self.known_bsb_numbers if normalized_bsb else False
+                normalized_bsb = bsb_values[bsb_index]
+                valid_bsb = normalized_bsb in self.known_bsb_numbers
 
                 # Apply rules
                 if has_keyword and valid_account and valid_bsb:
@@ -186,18 +286,20 @@ class AustraliaBankAccountRecognizer(PatternRecognizer):
                 start = min(acc_start, bsb_start)
                 end = max(acc_end, bsb_end)
 
-                if (start, end) in seen_spans:
+                span_key = start << 32 | end
+                if span_key in seen_spans:
                     continue
-                seen_spans.add((start, end))
-
-                results.append(
-                    RecognizerResult(
-                        entity_type=self.supported_entity,
-                        start=start,
-                        end=end,
-                        score=score,
-                        analysis_explanation=f"{reason} -> account={acc_val}, bsb={normalized_bsb}"
-                    )
-                )
-
-        return results
+                seen_spans.add(span_key)
+
+                pairs.append((start, end, score, reason, acc_val, normalized_bsb))
+
+        return [
+            RecognizerResult(
+                entity_type=self.supported_entity,
+                start=start,
+                end=end,
+                score=score,
+                analysis_explanation=f"{reason} -> account={acc_val}, bsb={self._format_bsb(normalized_bsb)}"
+            )
+            for start, end, score, reason, acc_val, normalized_bsb in pairs
+        ]
@@ -27,6 +27,9 @@ class AustraliaBusinessCompanyNumberRecognizer(PatternRecognizer):
         )
     ]
 
+    # Every match of the default patterns holds eleven digits
+    min_digits = 11
+
     CONTEXT = ["business number", "ABN", "Australia"]
 
     CONTEXT = [
@@ -52,4 +55,7 @@ class AustraliaBusinessCompanyNumberRecognizer(PatternRecognizer):
             context=context,
             supported_language=supported_language,
         )
+        if patterns is not self.PATTERNS:
+            # Custom patterns may match fewer digits
+            self.min_digits = 0
 
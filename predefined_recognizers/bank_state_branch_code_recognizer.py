@@ -17,6 +17,9 @@ class BSBCodeRecognizer(PatternRecognizer):
         ),
     ]
 
+    # Every match of the default patterns holds six digits
+    min_digits = 6
+
     CONTEXT = [
         "bank state branch",
         "bsb",
@@ -39,4 +42,7 @@ class BSBCodeRecognizer(PatternRecognizer):
             patterns=patterns,
             context=context,
             supported_language=supported_language,
-        )
\ No newline at end of file
+        )
+        if patterns is not self.PATTERNS:
+            # Custom patterns may match fewer digits
+            self.min_digits = 0
\ No newline at end of file
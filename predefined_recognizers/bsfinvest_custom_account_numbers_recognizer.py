@@ -1,7 +1,9 @@
 import re
+import os
 import logging
-from typing import Optional, List
+from typing import Optional, List, FrozenSet, Dict, Tuple, Sequence
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult, AnalysisExplanation
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -11,6 +13,21 @@ class BFSInvestCustomAccountRecognizer(PatternRecognizer):
     Custom recognizer for BFSInvest account numbers loaded from a file.
     """
 
+    # Context an account number must follow on the regular (up to 1000
+    # accounts) path: a keyword, then optional separators
+    PREFIX_REGEX = r"\b(?:account|id|bfsinvest)[\s:#-]*"
+    # The keyword alone
+    KEYWORD_REGEX = r"\b(?:account|id|bfsinvest)"
+
+    # Lists longer than this are matched word by word, without context
+    LARGE_LIST_SIZE = 1000
+
+    # Whitespace separated words, for the large list path
+    WORD_REGEX = re.compile(r"\S+")
+
+    # Account lists read from files, keyed by path, size and modification time
+    _ACCOUNT_FILE_CACHE: Dict[Tuple[str, int, int], Tuple[str, ...]] = {}
+
     def __init__(
         self,
         patterns: Optional[List[Pattern]] = None,
@@ -31,15 +48,27 @@ class BFSInvestCustomAccountRecognizer(PatternRecognizer):
         if not self.account_numbers:
             logger.warning(f"No valid account numbers loaded from {account_list_file}")
 
-        # Build regex pattern
-        account_pattern = "|".join(re.escape(acc) for acc in self.account_numbers) or "PLACEHOLDER"
+        # Instead of a regex alternation of every account, the text is scanned
+        # for the context keywords only; after each keyword and its
+        # separators the account set is probed once per account length, as
+        # in PREFIX_REGEX + account + word boundary
         flags = re.IGNORECASE if enable_case_insensitivity else 0
-        regex = re.compile(
-            rf"""\b(?:account|id|bfsinvest)[\s:#-]*({account_pattern})\b""",
-            re.VERBOSE | flags,
+        self.keyword_regex = re.compile(self.KEYWORD_REGEX, flags)
+        self.account_set = self._build_account_set(
+            self.account_numbers, enable_case_insensitivity
+        )
+        self.account_lengths = sorted({len(account) for account in self.account_set})
+
+        # Words of the text on the large list path, and validated matches,
+        # are looked up in this set
+        self.word_account_set = frozenset(
+            account.lower() if enable_case_insensitivity else account
+            for account in self.account_numbers
         )
 
-        pattern = Pattern(name=supported_entity, regex=regex, score=0.85)
+        pattern = Pattern(
+            name=supported_entity, regex=self.PREFIX_REGEX + r"(\S+)\b", score=0.85
+        )
 
         # Call super init AFTER defining self fields
         super().__init__(
@@ -49,49 +78,151 @@ class BFSInvestCustomAccountRecognizer(PatternRecognizer):
             supported_language=supported_language,
         )
 
-    def _load_account_numbers(self, file_path: str) -> List[str]:
+    def _load_account_numbers(self, file_path: str) -> Tuple[str, ...]:
         """Load and validate account numbers."""
         try:
-            with open(file_path, "r") as file:
-                return [line.strip() for line in file if line.strip()]
+            stat = os.stat(file_path)
+            # Recognizers built from the same, unchanged file share one parse
+            key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+            account_numbers = self._ACCOUNT_FILE_CACHE.get(key)
+            if account_numbers is None:
+                account_numbers = self._read_account_file(file_path)
+                self._ACCOUNT_FILE_CACHE[key] = account_numbers
+            return account_numbers
         except FileNotFoundError:
             logger.error(f"Account list file not found: {file_path}")
-            return []
+            return ()
         except Exception as e:
             logger.exception(f"Error loading accounts: {str(e)}")
-            return []
+            return ()
+
+    @staticmethod
+    def _read_account_file(file_path: str) -> Tuple[str, ...]:
+        """Read the stripped, non-empty lines of an account file in one go"""
+        with open(file_path) as file:
+            lines = file.read().split("\n")
+        return tuple(line.strip() for line in lines if line.strip())
+
+    @staticmethod
+    def _build_account_set(
+        account_numbers: Sequence[str], case_insensitive: bool
+    ) -> FrozenSet[str]:
+        """Build the set of accounts probed after a keyword."""
+        keys = (
+            (account.lower() if case_insensitive else account, account)
+            for account in account_numbers
+        )
+        # Offsets in the text must stay those of the original account
+        return frozenset(key for key, account in keys if len(key) == len(account))
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Whether the character counts as a word character for a \\b boundary."""
+        return char.isalnum() or char == "_"
 
     def analyze(self, text: str, entities: List[str], nlp_artifacts=None) -> List[RecognizerResult]:
         if not self.account_numbers:
             logger.debug("Skipping analysis - no account numbers available")
             return []
 
-        if len(self.account_numbers) > 1000:
+        if len(self.account_numbers) > self.LARGE_LIST_SIZE:
             return self._analyze_large_list(text)
 
-        return super().analyze(text, entities, nlp_artifacts)
+        return self._analyze_with_context(text)
+
+    def _analyze_with_context(self, text: str) -> List[RecognizerResult]:
+        """Find listed accounts that follow a context keyword."""
+        if not self.account_lengths:
+            return []
+
+        haystack = text
+        if self.enable_case_insensitivity:
+            haystack = Utils.lower_text(text)
+            # A few characters lowercase to several; keep offsets aligned
+            if len(haystack) != len(text):
+                haystack = "".join(
+                    lower if len(lower) == 1 else char
+                    for char, lower in ((char, char.lower()) for char in text)
+                )
 
-    def _analyze_large_list(self, text: str) -> List[RecognizerResult]:
         results = []
-        account_set = {acc.lower() for acc in self.account_numbers}
-        words = re.split(r"\s+", text)
+        for keyword in self.keyword_regex.finditer(text):
+            separators_end = keyword.end()
+            while separators_end < len(text) and (
+                text[separators_end] in ":#-" or text[separators_end].isspace()
+            ):
+                separators_end += 1
+
+            # Accounts may themselves start with a separator character, so
+            # every start within the separators is probed
+            for start in range(keyword.end(), separators_end + 1):
+                for length in self.account_lengths:
+                    end = start + length
+                    if end > len(text):
+                        break
+                    if haystack[start:end] not in self.account_set:
+                        continue
+
+                    # The account must end on a word boundary
+                    last_is_word = self._is_word_char(text[end - 1])
+                    next_is_word = end < len(text) and self._is_word_char(text[end])
+                    if last_is_word == next_is_word:
+                        continue
+
+                    results.append(self._build_context_result(text, start, end))
+        return results
 
-        for word in words:
-            clean = re.sub(r"^\W+|\W+$", "", word)
-            if not clean:
+    def _build_context_result(self, text: str, start: int, end: int) -> RecognizerResult:
+        """Build the result of an account found after a context keyword."""
+        account = text[start:end]
+        explanation = AnalysisExplanation(
+            recognizer=self.__class__.__name__,
+            original_score=self.patterns[0].score,
+            textual_explanation=f"Matched account number '{account}' after a context keyword.",
+            pattern_name=self.patterns[0].name,
+        )
+        explanation.set_supportive_context_word(account)
+
+        return RecognizerResult(
+            entity_type=self.supported_entity,
+            start=start,
+            end=end,
+            score=self.patterns[0].score,
+            analysis_explanation=explanation,
+        )
+
+    def _analyze_large_list(self, text: str) -> List[RecognizerResult]:
+        results = []
+        account_set = self.word_account_set
+
+        # Invariant across words, looked up once
+        case_insensitive = self.enable_case_insensitivity
+        score = self.patterns[0].score
+        pattern_name = self.patterns[0].name
+        entity = self.supported_entity
+        recognizer_name = self.__class__.__name__
+        is_word_char = self._is_word_char
+
+        # One pass over the words, which carry their own offsets
+        for word in self.WORD_REGEX.finditer(text):
+            start, end = word.span()
+            # Strip leading and trailing non-word characters
+            while start < end and not is_word_char(text[start]):
+                start += 1
+            while end > start and not is_word_char(text[end - 1]):
+                end -= 1
+            if start == end:
                 continue
-            candidate = clean.lower() if self.enable_case_insensitivity else clean
+            clean = text[start:end]
+            candidate = clean.lower() if case_insensitive else clean
 
             if candidate in account_set:
-                start = text.find(clean)
-                end = start + len(clean)
-
                 # Build proper analysis explanation object
                 explanation = AnalysisExplanation(
-                    recognizer=self.__class__.__name__,
-                    original_score=self.patterns[0].score,
+                    recognizer=recognizer_name,
+                    original_score=score,
                     textual_explanation=f"Matched account number '{clean}' from loaded list.",
-                    pattern_name=self.patterns[0].name,
+                    pattern_name=pattern_name,
                 )
                 explanation.set_supportive_context_word(clean)
 
@@ -99,10 +230,10 @@ class BFSInvestCustomAccountRecognizer(PatternRecognizer):
 
                 results.append(
                     RecognizerResult(
-                        entity_type=self.supported_entity,
+                        entity_type=entity,
                         start=start,
                         end=end,
-                        score=self.patterns[0].score,
+                        score=score,
                         analysis_explanation=explanation,
                     )
                 )
@@ -111,6 +242,6 @@ class BFSInvestCustomAccountRecognizer(PatternRecognizer):
     def validate_result(self, pattern_text: str) -> bool:
         """Validate matched account against loaded list."""
         if self.enable_case_insensitivity:
-            return any(pattern_text.lower() == acc.lower() for acc in self.account_numbers)
-        return pattern_text in self.account_numbers
+            return pattern_text.lower() in self.word_account_set
+        return pattern_text in self.word_account_set
 
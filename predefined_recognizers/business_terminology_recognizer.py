@@ -1,6 +1,7 @@
 from typing import List, Optional, Tuple
-import re
-from presidio_analyzer import Pattern, PatternRecognizer
+import regex as re
+from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
 class BusinessTerminologyRecognizer(PatternRecognizer):
@@ -13,26 +14,35 @@ class BusinessTerminologyRecognizer(PatternRecognizer):
     """
 
     # Define patterns to match business terminology
-    # Each pattern corresponds to a line in the logic.txt file
+    # Each pattern corresponds to a line in the logic.txt file. A term is not
+    # reported when a contract's terms and conditions follow it anywhere later
+    # in the text (see EXCLUSION_REGEX).
     PATTERNS = [
         Pattern(
             "accounts receivable turnover",
-            r"\baccounts receivable turnover\b(?!.*\bcontract\b.*terms\s+\w{1,2}\s+conditions\b)",
+            r"\baccounts receivable turnover\b",
             0.85,
         ),
         Pattern(
             "adjusted gross margin",
-            r"\badjusted gross margin\b(?!.*\bcontract\b.*terms\s+\w{1,2}\s+conditions\b)",
+            r"\badjusted gross margin\b",
             0.85,
         ),
         Pattern(
             "adjusted operating expenses",
-            r"\badjusted operating expenses\b(?!.*\bcontract\b.*terms\s+\w{1,2}\s+conditions\b)",
+            r"\badjusted operating expenses\b",
             0.85,
         ),
         # Repeat for all patterns following the same approach...
     ]
 
+    # Text after a term that excludes it. This used to be a negative lookahead
+    # on every term pattern, rescanning the rest of the text for each match;
+    # it is now resolved once per text in analyze.
+    EXCLUSION_REGEX = r"\bcontract\b.*terms\s+\w{1,2}\s+conditions\b"
+    CONTRACT_REGEX = r"\bcontract\b"
+    CONDITIONS_REGEX = r"terms\s+\w{1,2}\s+conditions\b"
+
     # Define patterns for terms that must appear in proximity to any of the above
     CONTEXT_PATTERNS = [
         Pattern(
@@ -75,6 +85,75 @@ class BusinessTerminologyRecognizer(PatternRecognizer):
             context=context,
             supported_language=supported_language,
         )
+        # Patterns the contract exclusion applies to
+        self.excluded_pattern_names = {pattern.name for pattern in self.PATTERNS}
+
+    def analyze(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+        regex_flags: Optional[int] = None,
+    ) -> List[RecognizerResult]:
+        """
+        Analyze text for business terms, then drop the excluded ones.
+
+        :param text: Text to be analyzed
+        :param entities: Entities this recognizer can detect
+        :param nlp_artifacts: Output values from the NLP engine
+        :param regex_flags: regex flags to be used in regex matching
+        :return: List of results detected by this recognizer.
+        """
+        results = super().analyze(text, entities, nlp_artifacts, regex_flags)
+        term_results = [
+            result
+            for result in results
+            if result.analysis_explanation is not None
+            and result.analysis_explanation.pattern_name in self.excluded_pattern_names
+        ]
+        if not term_results:
+            return results
+
+        flags = regex_flags if regex_flags else self.global_regex_flags
+        excluded = set()
+        if flags & re.DOTALL:
+            # A term ending at or before the last contract that still has
+            # terms and conditions after it is excluded, later ones are not
+            last_contract = self._last_excluding_contract(text, flags)
+            excluded = {
+                id(result) for result in term_results if result.end <= last_contract
+            }
+        else:
+            # The exclusion cannot cross lines, check it after each term
+            exclusion = re.compile(".*" + self.EXCLUSION_REGEX, flags)
+            excluded = {
+                id(result)
+                for result in term_results
+                if exclusion.match(text, result.end)
+            }
+
+        return [result for result in results if id(result) not in excluded]
+
+    def _last_excluding_contract(self, text: str, flags: int) -> int:
+        """
+        Return where the last "contract" followed by terms and conditions starts.
+
+        :param text: Text to be analyzed
+        :param flags: regex flags, including DOTALL
+        :return: The start offset, or -1 if the text has no such contract.
+        """
+        last_conditions = -1
+        for match in re.finditer(self.CONDITIONS_REGEX, text, flags):
+            last_conditions = match.start()
+        if last_conditions < 0:
+            return -1
+
+        last_contract = -1
+        for match in re.finditer(self.CONTRACT_REGEX, text, flags):
+            if match.end() > last_conditions:
+                break
+            last_contract = match.start()
+        return last_contract
 
     def validate_result(self, pattern_text: str) -> bool:
         """
@@ -1,19 +1,37 @@
 import re
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from typing import List, Optional
 
+
 class CASB1386Recognizer(PatternRecognizer):
     """
     Recognizer for detecting California CCN, CCN Track Data, California SSN, 
     and California Driver's License.
     """
 
+    # The single-pass alternation runs on the linear-time RE2 engine, which
+    # skips ahead to candidate first bytes in C, for ASCII text
+    use_re2 = True
+
     # Patterns for detecting California-specific personal data
     CCN_PATTERN = r"\b(?:4[0-9]{3}[-\s]?[0-9]{4}[-\s]?[0-9]{4}[-\s]?[0-9]{4}|5[1-5][0-9]{2}[-\s]?[0-9]{4}[-\s]?[0-9]{4}[-\s]?[0-9]{4})\b"  # Visa, Mastercard formats
     CCN_TRACK_DATA_PATTERN = r'Name\"\s*s\s\d+\s\"(?P<name>[\w\s\-]+)\".*?Credit_Card_Number\"\s*s\s\d+\s\"(?P<ccn>\d+)\".*?Issuer\"\s*s\s\d+\s\"(?P<issuer>\w+)\".*?Expiry[_\s]Date\"\s*s\s\d+\s\"(?P<expiry>\d{2}\\\/\d{2})\".*?cvv\"\s*s\s\d+\s\"(?P<cvv>\d{3})\"'
     CALIFORNIA_SSN_PATTERN = r"\b(?!000|666|9\d{2})\d{3}-(?!00)\d{2}-(?!0000)\d{4}\b"
     CALIFORNIA_DL_PATTERN = r"\b[A-Z]{1}[0-9]{7}\b"  # Pattern for California DL, format: 1 letter followed by 7 digits
 
+    # The SSN pattern spelled out without lookaheads, which RE2 lacks: an area
+    # other than 000, 666 and 9xx, a group other than 00 and a serial other
+    # than 0000. Same matches as CALIFORNIA_SSN_PATTERN on ASCII text.
+    CALIFORNIA_SSN_RE2_PATTERN = (
+        r"\b(?:00[1-9]|0[1-9]\d|[1-578]\d{2}|6[0-57-9]\d|66[0-57-9])"
+        r"-(?:0[1-9]|[1-9]\d)"
+        r"-(?:000[1-9]|00[1-9]\d|0[1-9]\d{2}|[1-9]\d{3})\b"
+    )
+
+    # Groups of the single-pass alternation, in the order of the patterns
+    GROUP_NAMES = ("card", "track", "ssn", "dl")
+
     # Context terms related to CCN, SSN, and driver's license
     CONTEXT_TERMS: List[str] = [
         "credit card", "card number", "ccn", "payment card",
@@ -33,44 +51,97 @@ class CASB1386Recognizer(PatternRecognizer):
             context=self.CONTEXT_TERMS,
             supported_language=supported_language
         )
+        self.pattern_by_group = dict(zip(self.GROUP_NAMES, patterns))
+
+        # The track data groups are only needed to validate its CCN, so they
+        # are left out of the alternation and read by matching again
+        track_regex = re.sub(r"\(\?P<\w+>", "(?:", self.CCN_TRACK_DATA_PATTERN)
+        regexes = [
+            self.CCN_PATTERN,
+            track_regex,
+            self.CALIFORNIA_SSN_PATTERN,
+            self.CALIFORNIA_DL_PATTERN,
+        ]
+        self.combined_regex = self._combine(regexes)
+        regexes[2] = self.CALIFORNIA_SSN_RE2_PATTERN
+        self.combined_ascii_regex = self._combine(regexes)
 
     def analyze(self, text: str, entities: List[str], nlp_artifacts=None) -> List[RecognizerResult]:
         """
         Analyze method to detect California personal data in text.
+
+        The patterns are matched in a single pass over the text, each in its
+        own named group. Its matches never overlap, so there are no
+        duplicates to remove.
         """
-        # Pass nlp_artifacts to the superclass analyze method
-        results = super().analyze(text, entities, nlp_artifacts=nlp_artifacts)
+        flags = self.global_regex_flags
+        ascii_text = Utils.ascii_bytes(text)
+        if ascii_text is not None:
+            combined = self._compile_regex(self.combined_ascii_regex, flags)
+            matches = self._finditer(combined, text, ascii_text)
+        else:
+            # RE2's \d, \w and \b only know ASCII; other text stays on the
+            # regex package so that e.g. full-width digits match as before
+            combined = self._compile_regex_cached(self.combined_regex, flags, False)
+            matches = combined.finditer(text)
 
         # Validate results with custom validation logic (e.g., Luhn validation for CCN)
         valid_results = []
-        for result in results:
-            if result.entity_type == "California Credit Card Number" and self.validate_ccn(text[result.start:result.end]):
-                valid_results.append(result)
-            elif result.entity_type == "California CCN Track Data" and self.validate_ccn(result.entity_value):
-                valid_results.append(result)
-            elif result.entity_type in ["California SSN", "California Driver's License"]:
-                valid_results.append(result)
+        for match in matches:
+            group = match.lastgroup
+            start, end = match.span()
+            if group == "card":
+                is_valid = self.validate_ccn(text[start:end])
+            elif group == "track":
+                is_valid = self.validate_ccn(self._track_data_ccn(text, start))
+            else:
+                is_valid = True
+            if not is_valid:
+                continue
+
+            pattern = self.pattern_by_group[group]
+            explanation = self.build_regex_explanation(
+                self.name, pattern.name, pattern.regex, pattern.score, None, flags
+            )
+            valid_results.append(
+                RecognizerResult(
+                    entity_type=self.supported_entities[0],
+                    start=start,
+                    end=end,
+                    score=pattern.score,
+                    analysis_explanation=explanation,
+                    recognition_metadata={
+                        RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                    },
+                )
+            )
 
         return valid_results
 
+    @classmethod
+    def _combine(cls, regexes: List[str]) -> str:
+        """
+        Join the regexes into one alternation, each in its group of GROUP_NAMES.
+        """
+        return "|".join(
+            f"(?P<{group}>{regex})" for group, regex in zip(cls.GROUP_NAMES, regexes)
+        )
+
+    def _track_data_ccn(self, text: str, start: int) -> str:
+        """
+        Return the card number of the track data matched at start.
+        """
+        track_regex = self._compile_regex_cached(
+            self.CCN_TRACK_DATA_PATTERN, self.global_regex_flags, False
+        )
+        return track_regex.match(text, start).group("ccn")
 
     def validate_ccn(self, ccn: str) -> bool:
         """
         Validate credit card number using the Luhn algorithm.
         """
-        def luhn_checksum(card_number: str) -> bool:
-            def digits_of(n):
-                return [int(d) for d in str(n)]
-            digits = digits_of(card_number)
-            odd_digits = digits[-1::-2]
-            even_digits = digits[-2::-2]
-            checksum = sum(odd_digits)
-            for d in even_digits:
-                checksum += sum(digits_of(d * 2))
-            return checksum % 10 == 0
-
-        cleaned_ccn = re.sub(r"\D", "", ccn)  # Remove non-digit characters
-        return luhn_checksum(cleaned_ccn)
+        return Utils.is_luhn_number(Utils.digits_of(ccn))
 
 # Sample input text
 # text = """
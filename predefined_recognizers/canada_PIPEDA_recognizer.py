@@ -1,5 +1,8 @@
-from typing import Optional, List, Any
+from bisect import bisect_left
+from typing import Optional, List, Any, Tuple
+from ahocorasick import Automaton
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -24,6 +27,9 @@ class CanadaPIPEDARecognizer(PatternRecognizer):
         "confidential", "identification", "tax id", "government id"
     ]
 
+    # Only SINs of nine digits are kept
+    min_digits = 9
+
     def __init__(
         self,
         patterns: Optional[List[Pattern]] = None,
@@ -41,6 +47,11 @@ class CanadaPIPEDARecognizer(PatternRecognizer):
             supported_language=supported_language,
         )
         self.check_luhn = check_luhn
+        # Finds every context keyword in one pass over the lowercased text
+        self.context_automaton = Automaton()
+        for keyword in self.CONTEXT:
+            self.context_automaton.add_word(keyword, len(keyword))
+        self.context_automaton.make_automaton()
 
     def analyze(
         self, text: str, entities: List[str], nlp_artifacts: Any = None
@@ -49,32 +60,55 @@ class CanadaPIPEDARecognizer(PatternRecognizer):
         # First get results from the pattern recognizer
         pattern_results = super().analyze(text, entities, nlp_artifacts)
         final_results = []
-        
+        if not pattern_results:
+            return final_results
+
+        # Context keyword spans of the whole text, sorted by start, so each
+        # result's window is answered with a bisect instead of a rescan
+        context_spans = self._find_context_spans(text)
+        if context_spans is not None:
+            context_starts = [start for start, _ in context_spans]
+
+        candidates = []
         for result in pattern_results:
             # Extract the matched SIN string
             sin_text = text[result.start:result.end]
             logger.debug(f"Potential SIN detected: {sin_text}")
             
             # Normalize to digits only
-            digits = re.sub(r"\D", "", sin_text)
+            digits = Utils.digits_of(sin_text)
             
             # Validate digit length
             if len(digits) != 9:
                 logger.debug(f"Invalid digit count ({len(digits)}), skipping: {sin_text}")
                 continue
-                
-            # Validate Luhn algorithm if enabled
-            if self.check_luhn and not self._luhn_check(digits):
+
+            candidates.append((result, sin_text, digits))
+
+        # Validate Luhn algorithm if enabled, for all candidates in one go
+        if self.check_luhn:
+            validations = Utils.are_luhn_numbers([digits for _, _, digits in candidates])
+        else:
+            validations = [True] * len(candidates)
+
+        for (result, sin_text, _), is_valid in zip(candidates, validations):
+            if not is_valid:
                 logger.info(f"Luhn check failed for SIN: {sin_text}")
                 continue
                 
             # Check for context terms in surrounding text
             start_ctx = max(0, result.start - 100)
             end_ctx = min(len(text), result.end + 100)
-            context_window = text[start_ctx:end_ctx].lower()
-            
+            if context_spans is None:
+                context_window = text[start_ctx:end_ctx].lower()
+                has_context = any(keyword in context_window for keyword in self.CONTEXT)
+            else:
+                has_context = self._has_context_in(
+                    context_spans, context_starts, start_ctx, end_ctx
+                )
+
             # Boost confidence if context terms are present
-            if any(keyword in context_window for keyword in self.CONTEXT):
+            if has_context:
                 logger.info(f"Context found for SIN: {sin_text}")
                 result.score = 1.0  # High confidence
             else:
@@ -85,6 +119,37 @@ class CanadaPIPEDARecognizer(PatternRecognizer):
             
         return final_results
 
+    def _find_context_spans(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Return the (start, end) spans of the context keywords, sorted by start.
+
+        None if lowercasing changes the text's length, as offsets in the
+        lowercased text would no longer be those of the text.
+        """
+        text_lower = Utils.lower_text(text)
+        if len(text_lower) != len(text):
+            return None
+        return sorted(
+            (end_index + 1 - length, end_index + 1)
+            for end_index, length in self.context_automaton.iter(text_lower)
+        )
+
+    @staticmethod
+    def _has_context_in(
+        context_spans: List[Tuple[int, int]],
+        context_starts: List[int],
+        start: int,
+        end: int,
+    ) -> bool:
+        """Whether a context keyword lies entirely within text[start:end]."""
+        for index in range(bisect_left(context_starts, start), len(context_spans)):
+            keyword_start, keyword_end = context_spans[index]
+            if keyword_start >= end:
+                break
+            if keyword_end <= end:
+                return True
+        return False
+
     @staticmethod
     def _luhn_check(digits: str) -> bool:
         """Validate SIN using Luhn algorithm"""
@@ -1,11 +1,10 @@
 import re
 import logging
 from typing import Optional, List
-from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult, EntityRecognizer
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 
-# Enable detailed debug logs
 logger = logging.getLogger("presidio-analyzer")
-logger.setLevel(logging.DEBUG)
 
 
 class CanadaDriversLicenceRecognizer(PatternRecognizer):
@@ -14,22 +13,24 @@ class CanadaDriversLicenceRecognizer(PatternRecognizer):
     Dynamically scores matches based on validation checks.
     """
 
+    # The patterns run as one alternation on the linear-time RE2 engine for
+    # ASCII text, with the Territories pattern spelled without its lookahead
+    use_re2 = True
+
     # ---------------------------
     # Regex Patterns (by Province)
     # ---------------------------
     PATTERNS = [
-        # Alberta: 6 digits + hyphen + 3 digits, or 5–9 digits
+        # Alberta: 6 digits + hyphen + 3 digits, or 5–9 digits.
+        # Its second branch also covers the all-digit formats of British Columbia
+        # (7 digits), New Brunswick (5–7), Prince Edward Island (5–6) and
+        # Saskatchewan (8), which validate_result tells apart; patterns of their
+        # own only produced duplicates of its matches.
         Pattern("Alberta DL", r"\b\d{6}-\d{3}\b|\b\d{5,9}\b", 0.8),
 
-        # British Columbia: 7 digits
-        Pattern("British Columbia DL", r"\b\d{7}\b", 0.75),
-
         # Manitoba: 2 letters - 2 letters - 2 letters - 1 letter + 3 digits + 2 letters (complex)
         Pattern("Manitoba DL", r"\b[A-Z]{2}-?[A-Z]{2}-?[A-Z]{2}-?[A-Z]\d{3}[A-Z]{2}\b", 0.85),
 
-        # New Brunswick: 5–7 digits
-        Pattern("New Brunswick DL", r"\b\d{5,7}\b", 0.75),
-
         # Newfoundland and Labrador: 1 letter + 9 digits
         Pattern("Newfoundland and Labrador DL", r"\b[A-Z]\d{9}\b", 0.9),
 
@@ -39,19 +40,31 @@ class CanadaDriversLicenceRecognizer(PatternRecognizer):
         # Ontario: 1 letter + 4 digits + optional hyphen + 5 digits + province-specific suffix
         Pattern("Ontario DL", r"\b[A-Z]\d{4}-?\d{5}\d[0156]\d[0-3]\d\b", 0.9),
 
-        # Prince Edward Island: 5–6 digits
-        Pattern("Prince Edward Island DL", r"\b\d{5,6}\b", 0.7),
-
         # Quebec: 1 letter + 12 digits
         Pattern("Quebec DL", r"\b[A-Z]\d{12}\b", 0.9),
 
-        # Saskatchewan: 8 digits
-        Pattern("Saskatchewan DL", r"\b\d{8}\b", 0.8),
-
-        # Northwest Territories, Yukon, Nunavut: 6–9 alphanumeric, must contain at least 1 digit
-        Pattern("Territories DL", r"\b(?=.*\d)[A-Z0-9]{6,9}\b", 0.65),
+        # Northwest Territories, Yukon, Nunavut: 6–9 alphanumeric, must contain at least 1 digit.
+        # The lookahead only reads the word itself: validate_result drops words without a
+        # digit anyway, and a lookahead over the rest of the text is quadratic in its length
+        Pattern("Territories DL", r"\b(?=[A-Z]*\d)[A-Z0-9]{6,9}\b", 0.65),
     ]
 
+    # The Territories pattern without its lookahead, which RE2 lacks. The words
+    # without a digit it also matches fail validate_result.
+    TERRITORIES_RE2_PATTERN = r"\b[A-Z0-9]{6,9}\b"
+
+    # ---------------------------------------
+    # Validation regexes, compiled once
+    # ---------------------------------------
+    NON_ALNUM_REGEX = re.compile(r"[^A-Za-z0-9]")
+    DIGIT_REGEX = re.compile(r"[0-9]")
+    ALBERTA_REGEX = re.compile(r"^\d{6}\d{3}$")
+    ALBERTA_HYPHEN_REGEX = re.compile(r"^\d{6}-\d{3}$")
+    QUEBEC_REGEX = re.compile(r"^[A-Z]\d{12}$")
+    SASKATCHEWAN_REGEX = re.compile(r"^\d{8}$")
+    BC_NB_REGEX = re.compile(r"^\d{7}$")
+    NEWFOUNDLAND_REGEX = re.compile(r"^[A-Z]\d{9}$")
+
     CONTEXT = [
         "driver licence",
         "drivers license",
@@ -85,6 +98,22 @@ class CanadaDriversLicenceRecognizer(PatternRecognizer):
             supported_language=supported_language,
         )
 
+        # The default patterns are matched in a single pass, each in its own
+        # group of the alternation, in the order of PATTERNS. Where several
+        # match at one position the first is also the longest, and no match
+        # overlaps another, so the pass finds the same results as matching
+        # each pattern and removing the duplicates.
+        self.combined_regex = None
+        if patterns is self.PATTERNS:
+            regexes = [pattern.regex for pattern in patterns]
+            regexes[-1] = self.TERRITORIES_RE2_PATTERN
+            self.pattern_by_group = {
+                f"p{index}": pattern for index, pattern in enumerate(patterns)
+            }
+            self.combined_regex = "|".join(
+                f"(?P<p{index}>{regex})" for index, regex in enumerate(regexes)
+            )
+
     # ------------------------------------------
     # Validation and Scoring Logic per Match
     # ------------------------------------------
@@ -93,32 +122,32 @@ class CanadaDriversLicenceRecognizer(PatternRecognizer):
         Lightweight validation logic for each matched DL number.
         Returns True if valid format, False otherwise.
         """
-        clean_text = re.sub(r"[^A-Za-z0-9]", "", pattern_text)
-        logger.debug(f"[VALIDATE] Raw: '{pattern_text}' | Cleaned: '{clean_text}'")
+        clean_text = self.NON_ALNUM_REGEX.sub("", pattern_text)
+        logger.debug("[VALIDATE] Raw: '%s' | Cleaned: '%s'", pattern_text, clean_text)
 
         if len(clean_text) < 5 or len(clean_text) > 15:
-            logger.debug(f"[INVALID] Length out of range ({len(clean_text)})")
+            logger.debug("[INVALID] Length out of range (%d)", len(clean_text))
             return False
 
         # Must have at least 5 characters and either digits or letters
-        if not re.search(r"[0-9]", clean_text):
+        if not self.DIGIT_REGEX.search(clean_text):
             logger.debug("[INVALID] Missing digits")
             return False
 
         # Province-specific lightweight validation rules
-        if re.match(r"^\d{6}\d{3}$", clean_text) or re.match(r"^\d{6}-\d{3}$", pattern_text):
+        if self.ALBERTA_REGEX.match(clean_text) or self.ALBERTA_HYPHEN_REGEX.match(pattern_text):
             logger.debug("[VALID] Alberta format")
             return True
-        if re.match(r"^[A-Z]\d{12}$", clean_text):
+        if self.QUEBEC_REGEX.match(clean_text):
             logger.debug("[VALID] Quebec format")
             return True
-        if re.match(r"^\d{8}$", clean_text):
+        if self.SASKATCHEWAN_REGEX.match(clean_text):
             logger.debug("[VALID] Saskatchewan format")
             return True
-        if re.match(r"^\d{7}$", clean_text):
+        if self.BC_NB_REGEX.match(clean_text):
             logger.debug("[VALID] BC or NB format")
             return True
-        if re.match(r"^[A-Z]\d{9}$", clean_text):
+        if self.NEWFOUNDLAND_REGEX.match(clean_text):
             logger.debug("[VALID] Newfoundland format")
             return True
 
@@ -129,15 +158,59 @@ class CanadaDriversLicenceRecognizer(PatternRecognizer):
         """
         Override to dynamically adjust score after validation.
         """
-        results = super().analyze(text, entities, nlp_artifacts)
+        ascii_text = Utils.ascii_bytes(text)
+        if self.combined_regex is None or ascii_text is None:
+            # Other Unicode letters and digits can match the patterns and then
+            # fail validation, so such text takes one pass per pattern
+            results = super().analyze(text, entities, nlp_artifacts)
+        else:
+            results = self._analyze_combined(text, ascii_text)
         for result in results:
             matched_text = text[result.start:result.end]
             is_valid = self.validate_result(matched_text)
             old_score = result.score
             result.score = max(0.7, old_score) if is_valid else min(0.69, old_score - 0.1)
             logger.debug(
-                f"[RESULT] '{matched_text}' | Valid={is_valid} | "
-                f"OldScore={old_score:.2f} → NewScore={result.score:.2f}"
+                "[RESULT] '%s' | Valid=%s | OldScore=%.2f → NewScore=%.2f",
+                matched_text,
+                is_valid,
+                old_score,
+                result.score,
             )
         return results
 
+    def _analyze_combined(self, text: str, ascii_text: bytes) -> List[RecognizerResult]:
+        """
+        Match all the default patterns in one pass over the ASCII text.
+
+        :param text: Text to be analyzed.
+        :param ascii_text: The text encoded.
+        :return: The validated matches, in order of their start.
+        """
+        flags = self.global_regex_flags
+        combined = self._compile_regex(self.combined_regex, flags)
+        results = []
+        for match in self._finditer(combined, text, ascii_text):
+            start, end = match.span()
+            if not self.validate_result(text[start:end]):
+                continue
+
+            pattern = self.pattern_by_group[match.lastgroup]
+            explanation = self.build_regex_explanation(
+                self.name, pattern.name, pattern.regex, pattern.score, True, flags
+            )
+            explanation.score = EntityRecognizer.MAX_SCORE
+            results.append(
+                RecognizerResult(
+                    entity_type=self.supported_entities[0],
+                    start=start,
+                    end=end,
+                    score=EntityRecognizer.MAX_SCORE,
+                    analysis_explanation=explanation,
+                    recognition_metadata={
+                        RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                    },
+                )
+            )
+        return results
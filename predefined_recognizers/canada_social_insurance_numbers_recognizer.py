@@ -1,5 +1,11 @@
-from typing import Optional, List
+from bisect import bisect_left
+from typing import Optional, List, Tuple
+from ahocorasick import Automaton
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
+
+# Deletes the spaces and hyphens separating the digit groups of a SIN
+_SEPARATOR_TABLE = str.maketrans("", "", " -")
 
 class CanadaSINRecognizer(PatternRecognizer):
     """
@@ -24,6 +30,10 @@ class CanadaSINRecognizer(PatternRecognizer):
     CONTEXT = [
         "social insurance number", "SIN", "Canada SIN", "Canadian", "canada social insurance number"
     ]
+    CONTEXT_LOWER = frozenset(map(str.lower, CONTEXT))
+
+    # Number of characters around the entity to check for context
+    CONTEXT_WINDOW = 50
 
     def __init__(
         self,
@@ -40,6 +50,11 @@ class CanadaSINRecognizer(PatternRecognizer):
             context=context,
             supported_language=supported_language,
         )
+        # Finds every context keyword in one pass over the lowercased text
+        self.context_automaton = Automaton()
+        for keyword in self.CONTEXT_LOWER:
+            self.context_automaton.add_word(keyword, len(keyword))
+        self.context_automaton.make_automaton()
 
     def analyze(self, text: str, entities: List[str], nlp_artifacts=None) -> List[RecognizerResult]:
         """
@@ -51,9 +66,28 @@ class CanadaSINRecognizer(PatternRecognizer):
         :return: List of RecognizerResult objects with detection details.
         """
         results = super().analyze(text, entities, nlp_artifacts)
-        
+        if not results:
+            return results
+
+        # Context keyword spans of the whole text, sorted by start, so each
+        # result's windows are answered with a bisect instead of a rescan
+        context_spans = self._find_context_spans(text)
+        if context_spans is not None:
+            context_starts = [start for start, _ in context_spans]
+
         for result in results:
-            if self._has_context(text, result.start, result.end):
+            if context_spans is None:
+                has_context = self._has_context(text, result.start, result.end)
+            else:
+                pre_start = max(0, result.start - self.CONTEXT_WINDOW)
+                post_end = result.end + self.CONTEXT_WINDOW
+                has_context = self._has_context_in(
+                    context_spans, context_starts, pre_start, result.start
+                ) or self._has_context_in(
+                    context_spans, context_starts, result.end, post_end
+                )
+
+            if has_context:
                 # Strong context match increases the score more significantly
                 result.score += 0.2
             else:
@@ -75,18 +109,49 @@ class CanadaSINRecognizer(PatternRecognizer):
         :param end: End position of the detected entity.
         :return: True if context words are found near the entity, False otherwise.
         """
-        window_size = 50  # Number of characters around the entity to check for context
+        window_size = self.CONTEXT_WINDOW
         pre_context = text[max(0, start - window_size):start].lower()
         post_context = text[end:end + window_size].lower()
 
-        for context_word in self.CONTEXT:
-            if context_word.lower() in pre_context or context_word.lower() in post_context:
+        return any(
+            context_word in pre_context or context_word in post_context
+            for context_word in self.CONTEXT_LOWER
+        )
+
+    def _find_context_spans(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Return the (start, end) spans of the context keywords, sorted by start.
+
+        None if lowercasing changes the text's length, as offsets in the
+        lowercased text would no longer be those of the text.
+        """
+        text_lower = Utils.lower_text(text)
+        if len(text_lower) != len(text):
+            return None
+        return sorted(
+            (end_index + 1 - length, end_index + 1)
+            for end_index, length in self.context_automaton.iter(text_lower)
+        )
+
+    @staticmethod
+    def _has_context_in(
+        context_spans: List[Tuple[int, int]],
+        context_starts: List[int],
+        start: int,
+        end: int,
+    ) -> bool:
+        """Whether a context keyword lies entirely within text[start:end]."""
+        for index in range(bisect_left(context_starts, start), len(context_spans)):
+            keyword_start, keyword_end = context_spans[index]
+            if keyword_start >= end:
+                break
+            if keyword_end <= end:
                 return True
         return False
 
     def validate_result(self, pattern_text: str) -> bool:
         """Validate SIN using Luhn algorithm."""
-        sin = pattern_text.replace(" ", "").replace("-", "")
+        sin = pattern_text.translate(_SEPARATOR_TABLE)
         if len(sin) != 9 or not sin.isdigit():
             return False
         return self._luhn_checksum(sin)
@@ -94,12 +159,4 @@ class CanadaSINRecognizer(PatternRecognizer):
     @staticmethod
     def _luhn_checksum(number: str) -> bool:
         """Validate a number using the Luhn algorithm."""
-        def digits_of(n):
-            return [int(d) for d in str(n)]
-        digits = digits_of(number)
-        odd_digits = digits[-1::-2]
-        even_digits = digits[-2::-2]
-        checksum = sum(odd_digits)
-        for d in even_digits:
-            checksum += sum(digits_of(d * 2))
-        return checksum % 10 == 0
+        return Utils.is_luhn_number(number)
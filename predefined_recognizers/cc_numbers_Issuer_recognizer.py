@@ -1,6 +1,13 @@
 import re
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
-from typing import List, Optional, Dict
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
+from typing import List, Optional, Dict, FrozenSet
+
+# Diners Club prefixes, looked up by a number's first three and first two
+# digits instead of comparing against each in turn
+_DINERS_CLUB_PREFIXES = frozenset(
+    ["300", "301", "302", "303", "304", "305", "309", "36", "38", "39"]
+)
 
 class CreditCardIssuerRecognizer(PatternRecognizer):
     """
@@ -16,8 +23,8 @@ class CreditCardIssuerRecognizer(PatternRecognizer):
             (len(x) >= 4 and 2221 <= int(x[:4]) <= 2720)          # 2221-2720 (new range)
         ),
         ("American Express", lambda x: len(x) >= 2 and x[:2] in ['34','37']),
-        ("Diners Club", lambda x: 
-            x.startswith(('300','301','302','303','304','305','309','36','38','39'))
+        ("Diners Club", lambda x:
+            x[:3] in _DINERS_CLUB_PREFIXES or x[:2] in _DINERS_CLUB_PREFIXES
         ),
         ("Discover", lambda x: 
             (x.startswith('6011')) or
@@ -35,14 +42,14 @@ class CreditCardIssuerRecognizer(PatternRecognizer):
     ]
 
     # Valid lengths per issuer
-    CREDIT_CARD_LENGTHS: Dict[str, List[int]] = {
-        "Visa": [13, 16, 19],
-        "MasterCard": [16],
-        "American Express": [15],
-        "Diners Club": [14, 15, 16, 17, 18, 19],
-        "Discover": [16, 17, 18, 19],
-        "JCB": [15, 16, 17, 18, 19],
-        "China UnionPay": [16, 17, 18, 19]
+    CREDIT_CARD_LENGTHS: Dict[str, FrozenSet[int]] = {
+        "Visa": frozenset({13, 16, 19}),
+        "MasterCard": frozenset({16}),
+        "American Express": frozenset({15}),
+        "Diners Club": frozenset({14, 15, 16, 17, 18, 19}),
+        "Discover": frozenset({16, 17, 18, 19}),
+        "JCB": frozenset({15, 16, 17, 18, 19}),
+        "China UnionPay": frozenset({16, 17, 18, 19})
     }
 
     CONTEXT_TERMS: List[str] = [
@@ -52,30 +59,38 @@ class CreditCardIssuerRecognizer(PatternRecognizer):
     ]
 
     def __init__(self, supported_language: Optional[str] = None):
-        # Match numbers with spaces/hyphens between digits
-        patterns = [Pattern("Credit Card", r'\b(?:\d[ -]*?){13,19}\b', 0.85)]
+        # Match numbers with spaces/hyphens between digits. A match ends at the
+        # first word boundary after its 13th digit, up to the 19th.
+        patterns = [Pattern("Credit Card", r'\b\d(?:[ -]*\d){12,18}?\b', 0.85)]
         super().__init__(
             supported_entity="CREDIT_CARD_ISSUER",
             patterns=patterns,
             supported_language=supported_language,
             context=self.CONTEXT_TERMS
         )
+        # Issuer of each six-digit prefix seen so far. The rules read no
+        # further than the sixth digit, so longer numbers sharing a prefix
+        # share an issuer.
+        self.issuer_by_prefix: Dict[str, Optional[str]] = {}
 
     def luhn_checksum(self, card_number: str) -> bool:
         """Validate credit card number using Luhn algorithm."""
-        def digits_of(n):
-            return [int(d) for d in str(n)]
-        
-        digits = digits_of(card_number)
-        odd_digits = digits[-1::-2]
-        even_digits = digits[-2::-2]
-        checksum = sum(odd_digits)
-        for d in even_digits:
-            checksum += sum(digits_of(d * 2))
-        return checksum % 10 == 0
+        return Utils.is_luhn_number(card_number)
 
     def determine_issuer(self, card_number: str) -> Optional[str]:
         """Determine issuer based on card number prefix."""
+        prefix = card_number[:6]
+        if len(prefix) < 6 or not prefix.isascii():
+            return self._match_issuer_rules(card_number)
+        try:
+            return self.issuer_by_prefix[prefix]
+        except KeyError:
+            issuer = self._match_issuer_rules(prefix)
+            self.issuer_by_prefix[prefix] = issuer
+            return issuer
+
+    def _match_issuer_rules(self, card_number: str) -> Optional[str]:
+        """Return the issuer of the first rule the card number satisfies."""
         for issuer, rule in self.CREDIT_CARD_ISSUER_RULES:
             try:
                 if rule(card_number):
@@ -86,12 +101,12 @@ class CreditCardIssuerRecognizer(PatternRecognizer):
 
     def analyze(self, text, entities, nlp_artifacts=None):
         results = super().analyze(text, entities, nlp_artifacts)
-        valid_results = []
+        candidates = []
 
         for result in results:
             # Extract matched text and remove non-digit characters
             matched_text = text[result.start:result.end]
-            card_number = re.sub(r"\D", "", matched_text)
+            card_number = Utils.digits_of(matched_text)
             length = len(card_number)
 
             # Skip if not within valid length range
@@ -102,11 +117,26 @@ class CreditCardIssuerRecognizer(PatternRecognizer):
             issuer = self.determine_issuer(card_number)
             if issuer is None:
                 continue
-            if length not in self.CREDIT_CARD_LENGTHS.get(issuer, []):
+            if length not in self.CREDIT_CARD_LENGTHS[issuer]:
                 continue
 
-            # Validate with Luhn algorithm (except China UnionPay)
-            if issuer != "China UnionPay" and not self.luhn_checksum(card_number):
+            candidates.append((result, card_number, issuer))
+
+        # Validate with Luhn algorithm (except China UnionPay), for all
+        # candidates in one go
+        luhn_indices = [
+            i for i, (_, _, issuer) in enumerate(candidates) if issuer != "China UnionPay"
+        ]
+        validations = [True] * len(candidates)
+        luhn_validations = Utils.are_luhn_numbers(
+            [candidates[i][1] for i in luhn_indices]
+        )
+        for i, is_valid in zip(luhn_indices, luhn_validations):
+            validations[i] = is_valid
+
+        valid_results = []
+        for (result, _, issuer), is_valid in zip(candidates, validations):
+            if not is_valid:
                 continue
 
             # Add issuer to metadata and keep result
@@ -1,6 +1,10 @@
 import re
+from ahocorasick import Automaton
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from presidio_analyzer.nlp_engine import NlpArtifacts
+from bisect import bisect_right
+from itertools import accumulate
 from typing import List, Optional, Dict, Any
 
 class CCTrackDataRecognizer(PatternRecognizer):
@@ -8,8 +12,12 @@ class CCTrackDataRecognizer(PatternRecognizer):
     Recognizer for detecting Credit Card Track Data (Track-1 and Track-2) in text.
     """
 
-    # Credit Card Number (CCN) pattern
-    CREDIT_CARD_PATTERN = r"\b(?:\d[ -]*?){13,19}\b"  # More flexible pattern
+    # Plain character-class patterns, safe for the linear-time RE2 engine
+    use_re2 = True
+
+    # Credit Card Number (CCN) pattern: 13-19 digits with spaces/hyphens between
+    # them, ending at the first word boundary after the 13th digit
+    CREDIT_CARD_PATTERN = r"\b\d(?:[ -]*\d){12,18}?\b"
 
     # Expiry Date pattern (MM/YY or MM/YYYY)
     EXPIRY_DATE_PATTERN = r"\b(0[1-9]|1[0-2])[/-]?(\d{2}|\d{4})\b"
@@ -17,6 +25,10 @@ class CCTrackDataRecognizer(PatternRecognizer):
     # Service code pattern (3 digits)
     SERVICE_CODE_PATTERN = r"\b\d{3}\b"
 
+    # Validation regexes, compiled once
+    EXPIRY_DATE_REGEX = re.compile(EXPIRY_DATE_PATTERN)
+    SERVICE_CODE_REGEX = re.compile(r"\d{3}")
+
     # Track data sentinels
     TRACK_1_SENTINEL = r"%B"
     TRACK_2_SENTINEL = r";"
@@ -54,20 +66,34 @@ class CCTrackDataRecognizer(PatternRecognizer):
         self.min_score_with_context = 0.7
         self.context_window = 50  # Characters around match to look for context
 
+        # Any context term, for checking a window in a single search
+        self.context_regex = re.compile(
+            r"\b(?:" + "|".join(map(re.escape, self.CONTEXT_TERMS)) + r")\b",
+            re.IGNORECASE,
+        )
+        # Every occurrence of the context terms in one pass over the lowercased
+        # text, overlapping ones included; each term maps to its length and to
+        # its positions in CONTEXT_TERMS, which lists some terms twice
+        term_indices: Dict[str, List[int]] = {}
+        for index, term in enumerate(self.CONTEXT_TERMS):
+            term_indices.setdefault(term.lower(), []).append(index)
+        self.context_automaton = Automaton()
+        for term, indices in term_indices.items():
+            self.context_automaton.add_word(term, (len(term), indices))
+        self.context_automaton.make_automaton()
+
     def analyze(
         self, 
         text: str, 
         entities: List[str], 
         nlp_artifacts: Optional[NlpArtifacts] = None
     ) -> List[RecognizerResult]:
-        # Detect base patterns
-        results = super().analyze(text, entities, nlp_artifacts)
-        
         # Add PERSON entities from NLP
+        person_results = []
         if nlp_artifacts and nlp_artifacts.entities:
             for entity in nlp_artifacts.entities:
                 if entity.label_ == "PERSON":
-                    results.append(
+                    person_results.append(
                         RecognizerResult(
                             entity_type="PERSON",
                             start=entity.start_char,
@@ -75,9 +101,21 @@ class CCTrackDataRecognizer(PatternRecognizer):
                             score=0.85
                         )
                     )
-        
+
         # Add context terms as hits
         context_results = self._detect_context_terms(text)
+
+        # The pattern results carry the recognizer's own entity type, which
+        # does not count towards track data. Without three person or context
+        # hits nothing is returned, so the patterns need not run at all.
+        if len(person_results) + len(context_results) < 3:
+            return []
+
+        # Detect base patterns
+        results = self._prune_service_codes(
+            super().analyze(text, entities, nlp_artifacts)
+        )
+        results.extend(person_results)
         results.extend(context_results)
         
         # Count valid CCNs and adjust scores
@@ -107,8 +145,74 @@ class CCTrackDataRecognizer(PatternRecognizer):
         
         return valid_results if track_data_count >= 3 else []
 
+    @staticmethod
+    def _pattern_name(result: RecognizerResult) -> Optional[str]:
+        """Name of the pattern a result was matched by, if any."""
+        explanation = result.analysis_explanation
+        return explanation.pattern_name if explanation else None
+
+    def _prune_service_codes(self, results: List[RecognizerResult]) -> List[RecognizerResult]:
+        """
+        Drop the service codes farther than context_window characters from any
+        card number or expiry date.
+
+        Any 3-digit number matches the service code pattern, so on their own
+        they are mostly years, amounts and the like.
+        """
+        anchors = sorted(
+            (result.start, result.end)
+            for result in results
+            if self._pattern_name(result) in ("CREDIT_CARD", "EXPIRY_DATE")
+        )
+        anchor_starts = [start for start, _ in anchors]
+        # Furthest end among the anchors up to each index
+        anchor_max_ends = list(accumulate((end for _, end in anchors), max))
+
+        def is_near_anchor(result: RecognizerResult) -> bool:
+            index = bisect_right(anchor_starts, result.end + self.context_window)
+            return index > 0 and anchor_max_ends[index - 1] >= result.start - self.context_window
+
+        return [
+            result
+            for result in results
+            if self._pattern_name(result) != "SERVICE_CODE" or is_near_anchor(result)
+        ]
+
     def _detect_context_terms(self, text: str) -> List[RecognizerResult]:
         """Detect context terms as separate hits"""
+        if not text.isascii():
+            # Case-insensitive matching folds some non-ASCII characters, like
+            # the long s, that lowercasing leaves as they are
+            return self._detect_context_terms_by_regex(text)
+
+        hits = []
+        for end_index, (length, indices) in self.context_automaton.iter(
+            Utils.lower_text(text)
+        ):
+            start, end = end_index + 1 - length, end_index + 1
+            if self._is_word_boundary(text, start) and self._is_word_boundary(text, end):
+                hits.extend((index, start, end) for index in indices)
+        # In the order the per-term searches found them
+        hits.sort()
+        return [
+            RecognizerResult(
+                entity_type="CREDIT_CARD_CONTEXT",
+                start=start,
+                end=end,
+                score=0.5
+            )
+            for _, start, end in hits
+        ]
+
+    @staticmethod
+    def _is_word_boundary(text: str, index: int) -> bool:
+        """Whether \\b matches at the index of the ASCII text."""
+        before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+        after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+        return before != after
+
+    def _detect_context_terms_by_regex(self, text: str) -> List[RecognizerResult]:
+        """Detect context terms with one search per term"""
         results = []
         for term in self.CONTEXT_TERMS:
             # Case-insensitive search with word boundaries
@@ -129,11 +233,7 @@ class CCTrackDataRecognizer(PatternRecognizer):
         start = max(0, result.start - self.context_window)
         end = min(len(text), result.end + self.context_window)
         context_area = text[start:end]
-        
-        for term in self.CONTEXT_TERMS:
-            if re.search(r"\b" + re.escape(term) + r"\b", context_area, re.IGNORECASE):
-                return True
-        return False
+        return self.context_regex.search(context_area) is not None
 
     def _count_valid_ccns(self, text: str, results: List[RecognizerResult]) -> int:
         """Count valid credit card numbers in results"""
@@ -147,23 +247,8 @@ class CCTrackDataRecognizer(PatternRecognizer):
 
     def validate_ccn(self, ccn: str) -> bool:
         """Validate credit card number using Luhn algorithm"""
-        def luhn_checksum(card_number: str) -> bool:
-            digits = [int(d) for d in card_number if d.isdigit()]
-            if not digits:
-                return False
-                
-            checksum = 0
-            parity = len(digits) % 2
-            for i, digit in enumerate(digits):
-                if i % 2 == parity:
-                    digit *= 2
-                    if digit > 9:
-                        digit -= 9
-                checksum += digit
-            return checksum % 10 == 0
-
-        cleaned_ccn = re.sub(r"\D", "", ccn)
-        return len(cleaned_ccn) >= 13 and luhn_checksum(cleaned_ccn)
+        cleaned_ccn = Utils.digits_of(ccn)
+        return len(cleaned_ccn) >= 13 and Utils.is_luhn_number(cleaned_ccn)
 
     def custom_validate_result(self, result: RecognizerResult, text: str) -> bool:
         """Custom validation for different track data components"""
@@ -174,10 +259,10 @@ class CCTrackDataRecognizer(PatternRecognizer):
             
         elif result.entity_type == "EXPIRY_DATE":
             # Validate expiry date format
-            return bool(re.fullmatch(self.EXPIRY_DATE_PATTERN, matched_text))
+            return bool(self.EXPIRY_DATE_REGEX.fullmatch(matched_text))
             
         elif result.entity_type == "SERVICE_CODE":
             # Validate service code is 3 digits
-            return bool(re.fullmatch(r"\d{3}", matched_text))
+            return bool(self.SERVICE_CODE_REGEX.fullmatch(matched_text))
             
         return True  # For other entity types (PERSON, CONTEXT, SENTINELS)
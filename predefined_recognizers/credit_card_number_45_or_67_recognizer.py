@@ -1,12 +1,16 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
 logger = logging.getLogger("presidio-analyzer")
 
 class CreditCardRecognizer(PatternRecognizer):
-    
+
+    # Plain character-class patterns, safe for the linear-time RE2 engine
+    use_re2 = True
+
     # Improved patterns for better coverage
     PATTERNS = [
         Pattern(
@@ -51,6 +55,8 @@ class CreditCardRecognizer(PatternRecognizer):
             context=context,
             supported_language=supported_language,
         )
+        # Any keyword, searched in one pass over the lowercased window
+        self.context_regex = re.compile("|".join(map(re.escape, self.CONTEXT)))
     
     def analyze(
         self, text: str, entities: List[str], nlp_artifacts=None
@@ -64,7 +70,7 @@ class CreditCardRecognizer(PatternRecognizer):
             logger.debug(f"Detected potential Credit Card: {original_card_number}")
             
             # Remove all non-digit characters for validation
-            cleaned_card_number = re.sub(r"[^\d]", "", original_card_number)
+            cleaned_card_number = Utils.digits_of(original_card_number)
             
             # Validation checks
             if len(cleaned_card_number) != 16:
@@ -80,7 +86,7 @@ class CreditCardRecognizer(PatternRecognizer):
                 logger.info(f"Valid credit card detected: {original_card_number}")
                 
                 # Context analysis
-                has_context = self._has_context(text, original_card_number)
+                has_context = self._has_context(text, result.start, result.end)
                 
                 if has_context:
                     logger.info(f"Context found for: {original_card_number}")
@@ -94,32 +100,15 @@ class CreditCardRecognizer(PatternRecognizer):
         
         return final_results
     
-    def _has_context(self, text: str, card_number: str) -> bool:
+    def _has_context(self, text: str, start: int, end: int) -> bool:
         """Check if context keywords are present near the card number."""
-        # Look for context in a window around the card number
-        start_pos = text.find(card_number)
-        if start_pos == -1:
-            return False
-            
         # Define context window (50 chars before and after)
-        window_start = max(0, start_pos - 50)
-        window_end = min(len(text), start_pos + len(card_number) + 50)
+        window_start = max(0, start - 50)
+        window_end = min(len(text), end + 50)
         context_window = text[window_start:window_end].lower()
-        
-        return any(keyword in context_window for keyword in self.CONTEXT)
-    
+
+        return self.context_regex.search(context_window) is not None
+
     def _is_valid_checksum(self, card_number: str) -> bool:
         """Validate the checksum using Luhn's algorithm."""
-        try:
-            total = 0
-            reverse_digits = card_number[::-1]
-            for i, digit in enumerate(reverse_digits):
-                n = int(digit)
-                if i % 2 == 1:  # Double every second digit
-                    n *= 2
-                    if n > 9:
-                        n -= 9
-                total += n
-            return total % 10 == 0
-        except (ValueError, IndexError):
-            return False
+        return Utils.is_luhn_number(card_number)
@@ -2,6 +2,7 @@ import re
 import logging
 from typing import List, Optional
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -30,6 +31,19 @@ class DatotelCreditDebitCardRecognizer(PatternRecognizer):
         r"\b3[47]\d{13}\b",
     ]
 
+    # The SSN regexes never overlap one another, so they run as one
+    # alternation with a group per regex, in the same order
+    SSN_COMBINED_REGEX = re.compile(
+        "|".join(f"({regex})" for regex in SSN_REGEXES)
+    )
+    # The plain 16 and 15 digit card regexes match exactly the numbers
+    # without separators that the formatted regex before each matches, so
+    # only the formatted ones run
+    FORMATTED_CARD_REGEXES = {
+        0: re.compile(CARD_REGEXES[0]),
+        2: re.compile(CARD_REGEXES[2]),
+    }
+
     KNOWN_INVALID_SSNS = {
         "123456789", "078051120", "111111111", "999999999",
         "000000000", "123123123", "456456456", "789789789"
@@ -58,50 +72,35 @@ class DatotelCreditDebitCardRecognizer(PatternRecognizer):
         if not text:
             return []
 
-        ssn_result = None
-        card_result = None
+        # Each result is the last match of the last regex that matches, as
+        # when the regexes ran one after another
 
         # --- Detect SSNs ---
-        for pattern in self.SSN_REGEXES:
-            for match in re.finditer(pattern, text):
-                digits = re.sub(r"\D", "", match.group())
-                if self.validate_ssn(digits):
-                    ssn_result = RecognizerResult(
-                        entity_type="SSN",
-                        start=match.start(),
-                        end=match.end(),
-                        score=0.9,
-                        recognition_metadata={"validity": "valid"},
-                    )
-                else:
-                    ssn_result = RecognizerResult(
-                        entity_type="SSN",
-                        start=match.start(),
-                        end=match.end(),
-                        score=0.5,
-                        recognition_metadata={"validity": "invalid"},
-                    )
+        last_ssn_matches = [None] * len(self.SSN_REGEXES)
+        for match in self.SSN_COMBINED_REGEX.finditer(text):
+            last_ssn_matches[match.lastindex - 1] = match
 
         # --- Detect Cards ---
-        for pattern in self.CARD_REGEXES:
-            for match in re.finditer(pattern, text):
-                digits = re.sub(r"\D", "", match.group())
-                if self.validate_card(digits):
-                    card_result = RecognizerResult(
-                        entity_type="Credit/Debit Card",
-                        start=match.start(),
-                        end=match.end(),
-                        score=0.9,
-                        recognition_metadata={"validity": "valid"},
-                    )
-                else:
-                    card_result = RecognizerResult(
-                        entity_type="Credit/Debit Card",
-                        start=match.start(),
-                        end=match.end(),
-                        score=0.5,
-                        recognition_metadata={"validity": "invalid"},
-                    )
+        last_card_matches = [None] * len(self.CARD_REGEXES)
+        for index, regex in self.FORMATTED_CARD_REGEXES.items():
+            for match in regex.finditer(text):
+                last_card_matches[index] = match
+                if match.group().isdigit():
+                    last_card_matches[index + 1] = match
+
+        ssn_result = None
+        ssn_match = self._last_of(last_ssn_matches)
+        if ssn_match:
+            digits = Utils.digits_of(ssn_match.group())
+            ssn_result = self._build_result("SSN", ssn_match, self.validate_ssn(digits))
+
+        card_result = None
+        card_match = self._last_of(last_card_matches)
+        if card_match:
+            digits = Utils.digits_of(card_match.group())
+            card_result = self._build_result(
+                "Credit/Debit Card", card_match, self.validate_card(digits)
+            )
 
         # ✅ Only return both if valid and score > 0.7
         if ssn_result and card_result and ssn_result.score > 0.7 and card_result.score > 0.7:
@@ -120,6 +119,25 @@ class DatotelCreditDebitCardRecognizer(PatternRecognizer):
 
     # ---------- HELPERS ----------
 
+    @staticmethod
+    def _last_of(matches: List[Optional[re.Match]]) -> Optional[re.Match]:
+        """The last of the matches that is not None."""
+        for match in reversed(matches):
+            if match:
+                return match
+        return None
+
+    @staticmethod
+    def _build_result(entity_type: str, match: re.Match, is_valid: bool) -> RecognizerResult:
+        """Build the result of a match, scored by its validity."""
+        return RecognizerResult(
+            entity_type=entity_type,
+            start=match.start(),
+            end=match.end(),
+            score=0.9 if is_valid else 0.5,
+            recognition_metadata={"validity": "valid" if is_valid else "invalid"},
+        )
+
     def validate_ssn(self, digits: str) -> bool:
         if len(digits) != 9 or digits in self.KNOWN_INVALID_SSNS:
             return False
@@ -140,14 +158,4 @@ class DatotelCreditDebitCardRecognizer(PatternRecognizer):
         return self._passes_luhn(digits)
 
     def _passes_luhn(self, number: str) -> bool:
-        total = 0
-        reverse_digits = number[::-1]
-        for i, d in enumerate(reverse_digits):
-            n = int(d)
-            if i % 2 == 1:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            total += n
-        return total % 10 == 0
-
+        return Utils.is_luhn_number(number)
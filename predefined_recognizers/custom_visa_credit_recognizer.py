@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -8,6 +9,9 @@ logger = logging.getLogger("presidio-analyzer")
 class VisaCreditCardRecognizer(PatternRecognizer):
     logger.info("Initializing Visa Credit Card Recognizer...")
 
+    # Plain character-class patterns, safe for the linear-time RE2 engine
+    use_re2 = True
+
     # Updated pattern for Visa: supports 13–19 digits, spaces, and hyphens
     PATTERNS = [
         Pattern(
@@ -18,6 +22,12 @@ class VisaCreditCardRecognizer(PatternRecognizer):
         )
     ]
 
+    # Strips the spaces and hyphens of a matched number
+    SEPARATOR_REGEX = re.compile(r"[\s-]")
+    SEPARATOR_TABLE = str.maketrans(
+        "", "", "".join(chr(c) for c in range(128) if chr(c).isspace() or chr(c) == "-")
+    )
+
     CONTEXT = [
         "visa", "visa card", "credit card", "visa credit card", "payment card", "card number"
     ]
@@ -49,7 +59,10 @@ class VisaCreditCardRecognizer(PatternRecognizer):
             logger.debug(f"Detected Visa Card Number: {card_number}, Confidence: {result.score}")
 
             # Clean up card number by removing spaces and hyphens
-            cleaned_card_number = re.sub(r"[\s-]", "", card_number)
+            if card_number.isascii():
+                cleaned_card_number = card_number.translate(self.SEPARATOR_TABLE)
+            else:
+                cleaned_card_number = self.SEPARATOR_REGEX.sub("", card_number)
 
             # Only proceed if it’s 13–19 digits
             if not (13 <= len(cleaned_card_number) <= 19 and cleaned_card_number.isdigit()):
@@ -62,7 +75,8 @@ class VisaCreditCardRecognizer(PatternRecognizer):
                 logger.info(f"Checksum valid for Visa card: {card_number}")
                 result.score = 0.7
                 # Boost confidence if Visa context is nearby
-                if any(keyword in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword in text_lower for keyword in self.CONTEXT):
                     logger.info(f"Context keywords found near Visa card: {card_number}, setting high confidence.")
                     result.score = 1.0
             else:
@@ -73,17 +87,4 @@ class VisaCreditCardRecognizer(PatternRecognizer):
 
     def _is_valid_checksum(self, card_number: str) -> bool:
         """Validate number using Luhn algorithm."""
-        sum_ = 0
-        alternate = False
-
-        for digit in reversed(card_number):
-            num = int(digit)
-            if alternate:
-                num *= 2
-                if num > 9:
-                    num -= 9
-            sum_ += num
-            alternate = not alternate
-
-        return sum_ % 10 == 0
-
+        return Utils.is_luhn_number(card_number)
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -8,6 +9,9 @@ logger = logging.getLogger("presidio-analyzer")
 class EUDebitCardRecognizer(PatternRecognizer):
     logger.info("Initializing EU Debit Card Recognizer...")
 
+    # Plain character-class patterns, safe for the linear-time RE2 engine
+    use_re2 = True
+
     # Define patterns for EU debit card numbers (formatted and unformatted)
     PATTERNS = [
         Pattern(
@@ -37,6 +41,14 @@ class EUDebitCardRecognizer(PatternRecognizer):
         )
     ]
 
+    # Strips the separators of a matched number
+    SEPARATOR_REGEX = re.compile(r"[-\s.]")
+    SEPARATOR_TABLE = str.maketrans(
+        "", "", "".join(chr(c) for c in range(128) if chr(c).isspace() or chr(c) in "-.")
+    )
+    # Expiration dates as MM/YY or MM/YYYY
+    EXPIRY_DATE_REGEX = re.compile(r"\b\d{2}/\d{2}\b|\b\d{2}/\d{4}\b")
+
     # Context keywords for debit cards
     CONTEXT = [
         "debit card", "card number", "security code", "expiration date", "expiry date", "cvv", "cvc", "valid thru", "exp", 
@@ -70,7 +82,10 @@ class EUDebitCardRecognizer(PatternRecognizer):
             logger.debug(f"Detected debit card number: {card_number}, Confidence: {result.score}")
 
             # Clean card number by removing spaces, hyphens, and dots
-            cleaned_card_number = re.sub(r"[-\s.]", "", card_number)
+            if card_number.isascii():
+                cleaned_card_number = card_number.translate(self.SEPARATOR_TABLE)
+            else:
+                cleaned_card_number = self.SEPARATOR_REGEX.sub("", card_number)
 
             # Perform Luhn checksum validation
             if self._is_valid_checksum(cleaned_card_number):
@@ -78,7 +93,8 @@ class EUDebitCardRecognizer(PatternRecognizer):
                 result.score = 0.7  # Medium confidence if checksum passes
                 
                 # Check for context keywords or expiration date format within the nearby text
-                if any(keyword in text.lower() for keyword in self.CONTEXT) or re.search(r"\b\d{2}/\d{2}\b|\b\d{2}/\d{4}\b", text):
+                text_lower = Utils.lower_text(text)
+                if any(keyword in text_lower for keyword in self.CONTEXT) or self.EXPIRY_DATE_REGEX.search(text):
                     logger.info(f"Context keywords or expiration date found near card number: {card_number}, setting high confidence.")
                     result.score = 1.0  # High confidence if keywords or expiration date format are found
             else:
@@ -91,17 +107,6 @@ class EUDebitCardRecognizer(PatternRecognizer):
         """
         Validate the card number using Luhn's algorithm (Modulus 10).
         """
-        sum_ = 0
-        alternate = False
-        
-        # Luhn's algorithm: process digits from right to left
-        for digit in reversed(card_number):
-            num = int(digit)
-            if alternate:
-                num *= 2
-                if num > 9:
-                    num -= 9
-            sum_ += num
-            alternate = not alternate
-        
-        return sum_ % 10 == 0
+        # The dotted pattern's separators match any character, so letters
+        # can remain after cleaning
+        return card_number.isdigit() and Utils.is_luhn_number(card_number)
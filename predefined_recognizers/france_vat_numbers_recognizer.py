@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -67,7 +68,8 @@ class FranceVATRecognizer(PatternRecognizer):
             if self._is_valid_vat(cleaned_vat):
                 logger.info(f"Valid VAT: {vat_number}")
                 result.score = 0.9  # High confidence for valid format
-                if any(keyword.lower() in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword.lower() in text_lower for keyword in self.CONTEXT):
                     logger.info(f"Context keywords found for VAT: {vat_number}")
                     result.score = 1.0  # Very high confidence with context
             else:
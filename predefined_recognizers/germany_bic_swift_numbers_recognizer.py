@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import re
 import logging
 
@@ -73,7 +74,7 @@ class GermanyBICSwiftRecognizer(PatternRecognizer):
         if not results:
             return results
 
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
         final_results = []
         
         for result in results:
@@ -164,7 +165,7 @@ class GermanyBICSwiftRecognizer(PatternRecognizer):
         """Check for invalidating terms near the match"""
         # Check 30 characters before and after
         start, end = result.start, result.end
-        context_window = text.lower()[max(0, start-30):min(len(text), end+30)]
+        context_window = Utils.lower_text(text)[max(0, start-30):min(len(text), end+30)]
         
         return any(
             invalid_term in context_window
@@ -6,6 +6,7 @@ import pickle
 import logging
 import re
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from typing import List, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from ahocorasick import Automaton
@@ -109,7 +110,7 @@ class ICD10Recognizer(PatternRecognizer):
         """Hybrid analysis with regex codes + Aho-Corasick descriptions."""
         start = time.time()
         results = []
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
 
         # Match ICD-10 codes
         for regex in self.code_regexes:
@@ -4,6 +4,7 @@ import json
 import logging
 from typing import List
 from presidio_analyzer import RecognizerResult, LocalRecognizer
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from ahocorasick import Automaton
 
 # Configure logger
@@ -109,7 +110,7 @@ class LowThresholdHIPAARecognizer(LocalRecognizer):
 
         logger.debug(f"Analyzing text: {text}")
 
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
 
         # 1️⃣ Numeric / SSN
         condition1 = []
@@ -3,6 +3,7 @@ import re
 import json
 from typing import List
 from presidio_analyzer import LocalRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from ahocorasick import Automaton
 
 
@@ -55,7 +56,7 @@ class HIPAAHITECHMEDIUMRecognizer(LocalRecognizer):
         if "HIPAA_HITECH_MEDIUM" not in entities:
             return []
 
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
         results = []
 
         # Condition A: Any of the 3 ID-based conditions
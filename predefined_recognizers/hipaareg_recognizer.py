@@ -3,6 +3,7 @@ import json
 import os
 from typing import List
 from presidio_analyzer import LocalRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from ahocorasick import Automaton
 
 class HipaaRegRecognizer(LocalRecognizer):
@@ -78,7 +79,7 @@ class HipaaRegRecognizer(LocalRecognizer):
         if "HIPAAREG" not in entities:
             return []
 
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
         condition_1_matches = []
         condition_2_matches = []
 
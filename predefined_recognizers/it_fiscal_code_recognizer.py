@@ -1,5 +1,6 @@
 from typing import List, Optional
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
@@ -95,7 +96,7 @@ class ItFiscalCodeRecognizer(PatternRecognizer):
         if not results:
             return results
 
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
         has_context = any(context_word in text_lower for context_word in self.context)
 
         for result in results:
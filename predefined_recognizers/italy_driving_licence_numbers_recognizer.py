@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 
 logger = logging.getLogger("presidio-analyzer")
@@ -45,6 +46,7 @@ class ItalyDriversLicenseRecognizer(PatternRecognizer):
         results = super().analyze(text, entities, nlp_artifacts)
         for result in results:
             # Increase the score if context keywords are found
-            if any(keyword in text.lower() for keyword in self.CONTEXT):
+            text_lower = Utils.lower_text(text)
+            if any(keyword in text_lower for keyword in self.CONTEXT):
                 result.score = min(result.score + 0.3, 1.0)  # Increase score by 0.3, cap at 1.0
         return results
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -53,7 +54,8 @@ class ItalyIBANRecognizer(PatternRecognizer):
             iban_number = text[result.start:result.end]
             logger.debug(f"Detected IBAN: {iban_number}, Confidence: {result.score}")
             # Adjust confidence based on context keywords
-            if any(keyword in text.lower() for keyword in self.CONTEXT):
+            text_lower = Utils.lower_text(text)
+            if any(keyword in text_lower for keyword in self.CONTEXT):
                 logger.info(f"Context keywords found for IBAN: {iban_number}, setting high confidence.")
                 result.score = 1.0  # High confidence if context keywords are present
             return results
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -62,7 +63,8 @@ class ItalyVATRecognizer(PatternRecognizer):
                 result.score = 0.5  
                 
                 # Increase score if keywords are found
-                if any(keyword.lower() in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword.lower() in text_lower for keyword in self.CONTEXT):
                     logger.info(f"Keyword found in text: {text}")
                     result.score = 1.0  # High confidence for valid VAT number with keywords
                 else:
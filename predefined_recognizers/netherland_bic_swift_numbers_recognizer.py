@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -57,7 +58,8 @@ class NetherlandsBICSwiftRecognizer(PatternRecognizer):
                 continue
 
             score = 0.6
-            if any(keyword in text.lower() for keyword in self.CONTEXT):
+            text_lower = Utils.lower_text(text)
+            if any(keyword in text_lower for keyword in self.CONTEXT):
                 score += 0.3
             result.score = min(score, 1.0)
 
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -55,7 +56,8 @@ class NetherlandsNationalIDRecognizer(PatternRecognizer):
             if self._is_valid_bsn(national_id):
                 logger.info(f"Valid BSN detected: {national_id}")
                 result.score = 0.7
-                if any(keyword.lower() in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword.lower() in text_lower for keyword in self.CONTEXT):
                     logger.info(f"Context keywords found. Boosting score for {national_id}")
                     result.score = 1.0
             else:
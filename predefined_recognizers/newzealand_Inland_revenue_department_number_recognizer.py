@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import re
 
 class NewZealandInlandRevenueDepartmentNumberRecognizer(PatternRecognizer):
@@ -78,7 +79,7 @@ class NewZealandInlandRevenueDepartmentNumberRecognizer(PatternRecognizer):
     # Check Context Keywords
     # ---------------------------------------------------------------------
     def _has_context_keywords(self, text: str) -> bool:
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
         for kw in self.CONTEXT:
             if re.search(r"\b" + re.escape(kw) + r"\b", text_lower):
                 print(f"✓ Found context keyword: '{kw}'")
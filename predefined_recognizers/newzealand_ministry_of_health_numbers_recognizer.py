@@ -1,5 +1,6 @@
 from typing import Optional, List, Dict, Any
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -76,7 +77,7 @@ class NewZealandHealthNumberRecognizer(PatternRecognizer):
         pattern_mapping = {pattern.regex: pattern.name for pattern in self.patterns}
         
         # Precompute context presence
-        lower_text = text.lower()
+        lower_text = Utils.lower_text(text)
         context_present = any(keyword in lower_text for keyword in self.CONTEXT)
 
         # Process each result
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 
 logger = logging.getLogger("presidio-analyzer")
@@ -63,7 +64,8 @@ class SpainBICSwiftRecognizer(PatternRecognizer):
             logger.debug(f"Detected BIC/SWIFT Number: {bic_swift_number}, Confidence: {result.score}")
             
             # Adjust confidence score based on presence of context keywords
-            if any(keyword in text.lower() for keyword in self.CONTEXT):
+            text_lower = Utils.lower_text(text)
+            if any(keyword in text_lower for keyword in self.CONTEXT):
                 logger.info(f"Context keywords found for BIC/SWIFT Number: {bic_swift_number}, setting high confidence.")
                 result.score = 1.0  # High confidence if context keywords are present
             else:
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import re
 import logging
 
@@ -83,7 +84,8 @@ class SpainIBANRecognizer(PatternRecognizer):
                 )
                 
                 # Increase the score if context keywords are found
-                if any(keyword in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword in text_lower for keyword in self.CONTEXT):
                     validated_result.score = min(validated_result.score + 0.2, 1.0)
                 
                 valid_results.append(validated_result)
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -63,7 +64,8 @@ class SpainDNIRecognizer(PatternRecognizer):
             return False
 
     def _adjust_score_based_on_context(self, text: str, result: RecognizerResult) -> float:
-        if any(keyword.lower() in text.lower() for keyword in self.CONTEXT):
+        text_lower = Utils.lower_text(text)
+        if any(keyword.lower() in text_lower for keyword in self.CONTEXT):
             return min(result.score + 0.3, 1.0)
         return result.score
 
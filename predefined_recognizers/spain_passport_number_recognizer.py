@@ -1,5 +1,6 @@
 from typing import Optional, List, Dict, Any
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import re
 import logging
 
@@ -74,7 +75,7 @@ class SpainPassportRecognizer(PatternRecognizer):
         final_results = list(unique_results.values())
         
         # Context analysis
-        lower_text = text.lower()
+        lower_text = Utils.lower_text(text)
         has_keyword = any(
             keyword in lower_text 
             for keyword in self.CONTEXT_KEYWORDS
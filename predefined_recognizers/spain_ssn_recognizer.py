@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -56,7 +57,8 @@ class SpainSSNRecognizer(PatternRecognizer):
                 logger.info(f"Checksum valid for SSN: {ssn}")
                 result.score = 0.7  # Medium confidence if checksum passes
                 # Check for context keywords in the surrounding text
-                if any(keyword in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword in text_lower for keyword in self.CONTEXT):
                     logger.info(f"Context keywords found for SSN: {ssn}, setting high confidence.")
                     result.score = 1.0  # High confidence if checksum passes and context keywords are present
             else:
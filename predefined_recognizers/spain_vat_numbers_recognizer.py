@@ -2,6 +2,7 @@ import re
 import logging
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 
 logger = logging.getLogger("presidio-analyzer")
 logger.setLevel(logging.DEBUG)
@@ -179,7 +180,8 @@ class SpainVATRecognizer(PatternRecognizer):
                     logger.debug(f"Invalid NIE checksum: {clean_vat}")
 
             # Adjust score based on context keywords
-            if any(keyword.lower() in text.lower() for keyword in self.CONTEXT):
+            text_lower = Utils.lower_text(text)
+            if any(keyword.lower() in text_lower for keyword in self.CONTEXT):
                 if score >= 0.7:
                     score = 1.0
                 else:
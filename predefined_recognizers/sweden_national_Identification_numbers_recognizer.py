@@ -1,5 +1,6 @@
 from typing import Optional, List
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 import logging
 import re
 
@@ -60,7 +61,8 @@ class SwedenNationalIDRecognizer(PatternRecognizer):
                 result.score = 0.7  # Medium confidence if checksum passes
                 
                 # Boost confidence if context keywords are present
-                if any(keyword in text.lower() for keyword in self.CONTEXT):
+                text_lower = Utils.lower_text(text)
+                if any(keyword in text_lower for keyword in self.CONTEXT):
                     logger.info(f"Context keywords found for National ID: {national_id}, setting high confidence.")
                     result.score = 1.0
             else:
@@ -2,6 +2,7 @@ import re
 import logging
 from typing import List, Optional
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -75,7 +76,7 @@ class USCorporateFinancialRecognizer(PatternRecognizer):
             logger.debug("Skipping due to 'terms and conditions'.")
             return results
 
-        normalized_text = text.lower()
+        normalized_text = Utils.lower_text(text)
         normalized_text = re.sub(r"\$([0-9]+(\.[0-9]+)?)", r" \$\1", normalized_text)
         normalized_text = re.sub(r"([0-9]+-[0-9-]+)", r" \1 ", normalized_text)
 
@@ -1,5 +1,6 @@
 import re
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
 from typing import List, Optional
 
 class NevadaRecognizer(PatternRecognizer):
@@ -91,7 +92,7 @@ class NevadaRecognizer(PatternRecognizer):
                 valid_results.append(result)
 
         # Check for context presence
-        text_lower = text.lower()
+        text_lower = Utils.lower_text(text)
         context_found = any(context_term in text_lower for context_term in self.CONTEXT_TERMS)
         
         # Boost score to 1.0 if context is present
@@ -12,145 +12,9 @@ import yaml
 from presidio_analyzer import EntityRecognizer, PatternRecognizer
 from presidio_analyzer.nlp_engine import NlpEngine, SpacyNlpEngine, StanzaNlpEngine
 from presidio_analyzer.predefined_recognizers import (
-    AbaRoutingRecognizer,
-    CreditCardRecognizer,
-    CryptoRecognizer,
-    DateRecognizer,
-    EmailRecognizer,
-    IbanRecognizer,
-    IpRecognizer,
-    MedicalLicenseRecognizer,
-    NhsRecognizer,
-    PhoneRecognizer,
-    UrlRecognizer,
-    UsBankRecognizer,
-    UsLicenseRecognizer,
-    UsItinRecognizer,
-    UsPassportRecognizer,
-    UsSsnRecognizer,
-    SgFinRecognizer,
     SpacyRecognizer,
-    EsNifRecognizer,
     StanzaRecognizer,
-    AuAbnRecognizer,
-    AuAcnRecognizer,
-    AuTfnRecognizer,
-    #AuMedicareRecognizer,
-    ItDriverLicenseRecognizer,
-    ItFiscalCodeRecognizer,
-    ItVatCodeRecognizer,
     TransformersRecognizer,
-    ItPassportRecognizer,
-    ItIdentityCardRecognizer,
-    # InPanRecognizer,
-    PlPeselRecognizer,
-    InAadhaarRecognizer,
-    InVehicleRegistrationRecognizer,
-    MedicalNumberRecognizer,
-    MedicalRecordNumberRecognizer,
-    DateOfBirthRecognizer,
-    EncounterNumberRecognizer,
-    WordlistRecognizer,
-    HICNRecognizer,
-    AustraliaBankAccountRecognizer,
-    BSBCodeRecognizer,
-    # AustraliaBusinessCompanyNumberRecognizer,
-    AustraliaMedicareCardRecognizer,
-    AustraliaBICRecognizer,
-    CanadaBICRecognizer,
-    CanadaDriversLicenceRecognizer,
-    CanadaSINRecognizer,
-    FranceNationalIdRecognizer,
-    FranceDriversLicenceRecognizer,
-    DrugRecognizer,
-    IngredientRecognizer,
-    ICD9Recognizer,    
-    ICD10Recognizer,
-    PatientIDRecognizer,
-    LowThresholdHIPAARecognizer,
-    BusinessTerminologyRecognizer,
-    US_Formatted_SSN_Recognizer,
-    # UnifiedRecognizer,
-    SSNAndTINRecognizer,
-    SSN_Formatted_Unformatted_Recognizer,
-    GermanDriversLicenseRecognizer,
-    GermanIDCardRecognizer,
-    GermanPassportRecognizer,
-    GermanIBANRecognizer,
-    GermanVATRecognizer,
-    FerpaRecognizer,
-    AllCreditCardNumberRecognizer,
-    CreditCardIssuerRecognizer,
-    CCTrackDataRecognizer,
-    USDriversLicenseRecognizer,
-    # ItalyBICSwiftRecognizer,
-    PCI_DSS_CreditCardAndTrackDataRecognizer,
-    US_AZSB1338Recognizer,
-    CASB1386Recognizer,
-    COHB1119Recognizer,
-    ConnecticutDLPRecognizer,
-    ColumbiaDLPRecognizer,
-    FLHB481Recognizer,
-    IdahoSB1374Recognizer,
-    LouisianaRecognizer,
-    MassachusettsDataRecognizer,
-    MinnesotaRecognizer,
-    NevadaRecognizer,
-    NewJerseyDLPRecognizer,
-    NewHampshirePolicyRecognizer,
-    NewYorkDataRecognizer,
-    OhioDataRecognizer,
-    OklahomaRecognizer,
-    PennsylvaniaRecognizer,
-    TexasPolicyRecognizer,
-    UtahPolicyRecognizer,
-    WashingtonStateRecognizer,
-    UKDriversLicenseRecognizer,
-    UKNINORecognizer,
-    UKPassportRecognizer,
-    UKTaxpayerRecognizer,
-    ItalyDriversLicenseRecognizer,
-    ItalyFiscalCodeRecognizer,
-    ItalyVATRecognizer,
-    NetherlandsPassportRecognizer,
-    NetherlandsVATRecognizer,
-    SpainIBANRecognizer,
-    SpainDNIRecognizer,
-    SpainPassportRecognizer,
-    SpainSSNRecognizer,
-    SpainVATRecognizer,
-    EUBICSwiftRecognizer,
-    ItalyIBANRecognizer,
-    NetherlandsIBANRecognizer,
-    NetherlandsDriversLicenseRecognizer,
-    NetherlandsNationalIDRecognizer,
-    NewZealandInlandRevenueDepartmentNumberRecognizer,
-    NewZealandHealthNumberRecognizer,
-    FranceBICSwiftRecognizer,
-    GermanyBICSwiftRecognizer,
-    NetherlandsBICSwiftRecognizer,
-    SpainBICSwiftRecognizer,
-    SwedenNationalIDRecognizer,
-    FranceIBANRecognizer,
-    FranceVATRecognizer,
-    USCustomSSNRecognizer,
-    EUDebitCardRecognizer,
-    EU_IBANRecognizer,
-    EUVATRecognizer,
-    SwedenIBANRecognizer,
-    SwedenBICSwiftRecognizer,
-    SwedenPassportRecognizer,
-    SwedenVATRecognizer,
-    CanadaPIPEDARecognizer,
-    VisaCreditCardRecognizer,
-    DatotelCreditDebitCardRecognizer,
-    BFSInvestCustomAccountRecognizer,
-    BGFinincCustomWordlistRecognizer,
-    HIPAAHITECHMEDIUMRecognizer,
-    DOBRecognizer,
-    NPIRecognizer,
-    HipaaRegRecognizer,
-    USCorporateFinancialRecognizer,
 )
 
 logger = logging.getLogger("presidio-analyzer")
@@ -188,6 +52,146 @@ class RecognizerRegistry:
         :param nlp_engine: The NLP engine to use.
         :return: None
         """
+        # Imported here so the recognizer modules load only when needed
+        from presidio_analyzer.predefined_recognizers import (
+            AbaRoutingRecognizer,
+            CreditCardRecognizer,
+            CryptoRecognizer,
+            DateRecognizer,
+            EmailRecognizer,
+            IbanRecognizer,
+            IpRecognizer,
+            MedicalLicenseRecognizer,
+            NhsRecognizer,
+            PhoneRecognizer,
+            UrlRecognizer,
+            UsBankRecognizer,
+            UsLicenseRecognizer,
+            UsItinRecognizer,
+            UsPassportRecognizer,
+            UsSsnRecognizer,
+            SgFinRecognizer,
+            EsNifRecognizer,
+            AuAbnRecognizer,
+            AuAcnRecognizer,
+            AuTfnRecognizer,
+            #AuMedicareRecognizer,
+            ItDriverLicenseRecognizer,
+            ItFiscalCodeRecognizer,
+            ItVatCodeRecognizer,
+            ItPassportRecognizer,
+            ItIdentityCardRecognizer,
+            # InPanRecognizer,
+            PlPeselRecognizer,
+            InAadhaarRecognizer,
+            InVehicleRegistrationRecognizer,
+            MedicalNumberRecognizer,
+            MedicalRecordNumberRecognizer,
+            DateOfBirthRecognizer,
+            EncounterNumberRecognizer,
+            WordlistRecognizer,
+            HICNRecognizer,
+            AustraliaBankAccountRecognizer,
+            BSBCodeRecognizer,
+            # AustraliaBusinessCompanyNumberRecognizer,
+            AustraliaMedicareCardRecognizer,
+            AustraliaBICRecognizer,
+            CanadaBICRecognizer,
+            CanadaDriversLicenceRecognizer,
+            CanadaSINRecognizer,
+            FranceNationalIdRecognizer,
+            FranceDriversLicenceRecognizer,
+            DrugRecognizer,
+            IngredientRecognizer,
+            ICD9Recognizer,    
+            ICD10Recognizer,
+            PatientIDRecognizer,
+            LowThresholdHIPAARecognizer,
+            BusinessTerminologyRecognizer,
+            US_Formatted_SSN_Recognizer,
+            # UnifiedRecognizer,
+            SSNAndTINRecognizer,
+            SSN_Formatted_Unformatted_Recognizer,
+            GermanDriversLicenseRecognizer,
+            GermanIDCardRecognizer,
+            GermanPassportRecognizer,
+            GermanIBANRecognizer,
+            GermanVATRecognizer,
+            FerpaRecognizer,
+            AllCreditCardNumberRecognizer,
+            CreditCardIssuerRecognizer,
+            CCTrackDataRecognizer,
+            USDriversLicenseRecognizer,
+            # ItalyBICSwiftRecognizer,
+            PCI_DSS_CreditCardAndTrackDataRecognizer,
+            US_AZSB1338Recognizer,
+            CASB1386Recognizer,
+            COHB1119Recognizer,
+            ConnecticutDLPRecognizer,
+            ColumbiaDLPRecognizer,
+            FLHB481Recognizer,
+            IdahoSB1374Recognizer,
+            LouisianaRecognizer,
+            MassachusettsDataRecognizer,
+            MinnesotaRecognizer,
+            NevadaRecognizer,
+            NewJerseyDLPRecognizer,
+            NewHampshirePolicyRecognizer,
+            NewYorkDataRecognizer,
+            OhioDataRecognizer,
+            OklahomaRecognizer,
+            PennsylvaniaRecognizer,
+            TexasPolicyRecognizer,
+            UtahPolicyRecognizer,
+            WashingtonStateRecognizer,
+            UKDriversLicenseRecognizer,
+            UKNINORecognizer,
+            UKPassportRecognizer,
+            UKTaxpayerRecognizer,
+            ItalyDriversLicenseRecognizer,
+            ItalyFiscalCodeRecognizer,
+            ItalyVATRecognizer,
+            NetherlandsPassportRecognizer,
+            NetherlandsVATRecognizer,
+            SpainIBANRecognizer,
+            SpainDNIRecognizer,
+            SpainPassportRecognizer,
+            SpainSSNRecognizer,
+            SpainVATRecognizer,
+            EUBICSwiftRecognizer,
+            ItalyIBANRecognizer,
+            NetherlandsIBANRecognizer,
+            NetherlandsDriversLicenseRecognizer,
+            NetherlandsNationalIDRecognizer,
+            NewZealandInlandRevenueDepartmentNumberRecognizer,
+            NewZealandHealthNumberRecognizer,
+            FranceBICSwiftRecognizer,
+            GermanyBICSwiftRecognizer,
+            NetherlandsBICSwiftRecognizer,
+            SpainBICSwiftRecognizer,
+            SwedenNationalIDRecognizer,
+            FranceIBANRecognizer,
+            FranceVATRecognizer,
+            USCustomSSNRecognizer,
+            EUDebitCardRecognizer,
+            EU_IBANRecognizer,
+            EUVATRecognizer,
+            SwedenIBANRecognizer,
+            SwedenBICSwiftRecognizer,
+            SwedenPassportRecognizer,
+            SwedenVATRecognizer,
+            CanadaPIPEDARecognizer,
+            VisaCreditCardRecognizer,
+            DatotelCreditDebitCardRecognizer,
+            BFSInvestCustomAccountRecognizer,
+            BGFinincCustomWordlistRecognizer,
+            HIPAAHITECHMEDIUMRecognizer,
+            DOBRecognizer,
+            NPIRecognizer,
+            HipaaRegRecognizer,
+            USCorporateFinancialRecognizer,
+        )
+
         if not languages:
             languages = ["en"]
 
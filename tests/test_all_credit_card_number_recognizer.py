@@ -0,0 +1,38 @@
+import pytest
+
+from presidio_analyzer.predefined_recognizers.all_credit_card_number_recognizer import (
+    AllCreditCardNumberRecognizer,
+)
+
+
+@pytest.fixture(scope="module")
+def recognizer():
+    return AllCreditCardNumberRecognizer()
+
+
+@pytest.mark.parametrize(
+    "text, expected_span",
+    [
+        (
+            "# 513206227507988 3731773851420 00582052000 4797-5913-2515-2533",
+            (44, 63),
+        ),
+        ("exp 12/25 6011 2903 5780 0573", (10, 29)),
+    ],
+)
+def test_card_starting_inside_rejected_match_is_found(recognizer, text, expected_span):
+    results = recognizer.analyze(text, ["CREDIT_CARD"])
+
+    assert expected_span in [(result.start, result.end) for result in results]
+
+
+def test_several_cards_on_one_line(recognizer):
+    text = "cards 4111 1111 1111 1111, 5500-0000-0000-0004 and 340000000000009"
+
+    spans = {(result.start, result.end) for result in recognizer.analyze(text, [])}
+
+    assert {(6, 25), (27, 46), (51, 66)} <= spans
+
+
+def test_text_with_too_few_digits(recognizer):
+    assert recognizer.analyze("card 4111 1111", ["CREDIT_CARD"]) == []
@@ -0,0 +1,73 @@
+import pytest
+
+from presidio_analyzer.predefined_recognizers.ca_CASB1386_recognizer import (
+    CASB1386Recognizer,
+)
+
+TRACK_DATA = (
+    'Name" s 1 "John Doe" Credit_Card_Number" s 2 "{ccn}" Issuer" s 3 "Visa"'
+    ' Expiry_Date" s 4 "12\\/25" cvv" s 5 "123"'
+)
+
+
+@pytest.fixture(scope="module")
+def recognizer():
+    return CASB1386Recognizer()
+
+
+def _found(recognizer, text):
+    return [
+        (result.start, result.end, result.analysis_explanation.pattern_name)
+        for result in recognizer.analyze(text, ["US_CASB1386"])
+    ]
+
+
+def test_card_number_must_pass_luhn(recognizer):
+    text = "CCN 4111 1111 1111 1111 and 4111 1111 1111 1112"
+
+    assert _found(recognizer, text) == [(4, 23, "California Credit Card Number")]
+
+
+def test_ssn_and_driver_license_are_kept(recognizer):
+    text = "SSN 123-45-6789, 666-12-3456, DL A1234567"
+
+    assert sorted(_found(recognizer, text)) == [
+        (4, 15, "California SSN"),
+        (33, 41, "California Driver's License"),
+    ]
+
+
+def test_track_data_card_number_must_pass_luhn(recognizer):
+    valid = TRACK_DATA.format(ccn="4111111111111111")
+    invalid = TRACK_DATA.format(ccn="4111111111111112")
+
+    assert _found(recognizer, valid) == [
+        (0, len(valid), "California CCN Track Data")
+    ]
+    assert _found(recognizer, invalid) == []
+
+
+def test_results_have_the_recognizer_entity(recognizer):
+    results = recognizer.analyze("DL A1234567", ["US_CASB1386"])
+
+    assert [result.entity_type for result in results] == ["US_CASB1386"]
+
+
+@pytest.mark.parametrize(
+    "ccn, expected",
+    [
+        ("4111111111111111", True),
+        ("4111 1111 1111 1111", True),
+        ("4111-1111-1111-1112", False),
+        ("５５００ ００００ ００００ ０００４", True),
+        ("５５００ ００００ ００００ ０００５", False),
+    ],
+)
+def test_validate_ccn(recognizer, ccn, expected):
+    assert recognizer.validate_ccn(ccn) is expected
+
+
+def test_dashed_card_number_is_validated(recognizer):
+    text = "cards 5500-0000-0000-0004, 5500-0000-0000-0005"
+
+    assert _found(recognizer, text) == [(6, 25, "California Credit Card Number")]
@@ -0,0 +1,41 @@
+import pytest
+
+from presidio_analyzer.pattern_prefilter import PatternPrefilter
+from presidio_analyzer.predefined_recognizers.au_acn_recognizer import AuAcnRecognizer
+from presidio_analyzer.predefined_recognizers.word_list_recognizer import (
+    WordlistRecognizer,
+)
+
+re2 = pytest.importorskip("re2")
+
+
+@pytest.mark.parametrize(
+    "recognizer_class, text",
+    [
+        (AuAcnRecognizer, "acn 004\x0b085\x0b616"),
+        (WordlistRecognizer, "Income\x0btaxes were paid"),
+    ],
+)
+def test_prefilter_keeps_recognizers_matching_vertical_tab(recognizer_class, text):
+    recognizer = recognizer_class()
+    assert recognizer.analyze(text, recognizer.supported_entities)
+
+    skipped = PatternPrefilter().get_skipped_recognizers(text, [recognizer])
+
+    assert recognizer.id not in skipped
+
+
+def test_prefilter_skips_recognizers_without_matches():
+    recognizer = AuAcnRecognizer()
+
+    skipped = PatternPrefilter().get_skipped_recognizers("nothing here", [recognizer])
+
+    assert skipped == {recognizer.id}
+
+
+def test_prefilter_skips_nothing_when_the_match_fails(monkeypatch):
+    recognizer = AuAcnRecognizer()
+    prefilter = PatternPrefilter()
+    monkeypatch.setattr(re2.Set, "Match", lambda self, text: None)
+
+    assert prefilter.get_skipped_recognizers("nothing here", [recognizer]) == set()
@@ -0,0 +1,54 @@
+import pytest
+
+from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils as Utils
+
+re2 = pytest.importorskip("re2")
+
+
+class Re2Recognizer(PatternRecognizer):
+    use_re2 = True
+
+
+class RegexRecognizer(PatternRecognizer):
+    use_re2 = False
+
+
+PATTERNS = [
+    Pattern("spaced", r"\b\d{3}\s\d{3}\s\d{3}\b", 0.5),
+    Pattern("class", r"\b\d{4}[-\s]\d{4}\b", 0.5),
+    Pattern("negated", r"\bid:\S+", 0.5),
+]
+
+
+def spans(recognizer_class, text):
+    recognizer = recognizer_class(supported_entity="TEST", patterns=PATTERNS)
+    return sorted((r.start, r.end) for r in recognizer.analyze(text, ["TEST"]))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "acn 004\x0b085\x0b616",
+        "card 1234\x0b5678 and 1234 5678",
+        "id:abc\x0bdef id:ghi jkl",
+        "tabs\t123\t456\t789\x0c",
+    ],
+)
+def test_re2_and_regex_spans_match_with_vertical_tab(text):
+    assert spans(Re2Recognizer, text) == spans(RegexRecognizer, text)
+    assert spans(Re2Recognizer, text)
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [
+        (r"a\sb", "a[\\t\\n\\v\\f\\r ]b"),
+        (r"[-\s]", "[-\\t\\n\\v\\f\\r ]"),
+        (r"\S+", "[^\\t\\n\\v\\f\\r ]+"),
+        (r"\\s", r"\\s"),
+        (r"[\S]", None),
+    ],
+)
+def test_to_re2_regex(regex, expected):
+    assert Utils.to_re2_regex(regex) == expected